@@ -47,6 +47,26 @@ class EventClassLogLevel:
     DEBUG = native_bt.EVENT_CLASS_LOG_LEVEL_DEBUG
 
 
+# valid log levels, built once for the log level setter's check
+_EVENT_CLASS_LOG_LEVELS = frozenset((
+    EventClassLogLevel.EMERGENCY,
+    EventClassLogLevel.ALERT,
+    EventClassLogLevel.CRITICAL,
+    EventClassLogLevel.ERROR,
+    EventClassLogLevel.WARNING,
+    EventClassLogLevel.NOTICE,
+    EventClassLogLevel.INFO,
+    EventClassLogLevel.DEBUG_SYSTEM,
+    EventClassLogLevel.DEBUG_PROGRAM,
+    EventClassLogLevel.DEBUG_PROCESS,
+    EventClassLogLevel.DEBUG_MODULE,
+    EventClassLogLevel.DEBUG_UNIT,
+    EventClassLogLevel.DEBUG_FUNCTION,
+    EventClassLogLevel.DEBUG_LINE,
+    EventClassLogLevel.DEBUG,
+))
+
+
 class EventClass(object._Object):
     def __init__(self, name, id=None, log_level=None, emf_uri=None,
                  context_field_class=None, payload_field_class=None):
@@ -102,26 +122,7 @@ class EventClass(object._Object):
 
     @log_level.setter
     def log_level(self, log_level):
-        log_levels = (
-            EventClassLogLevel.UNSPECIFIED,
-            EventClassLogLevel.EMERGENCY,
-            EventClassLogLevel.ALERT,
-            EventClassLogLevel.CRITICAL,
-            EventClassLogLevel.ERROR,
-            EventClassLogLevel.WARNING,
-            EventClassLogLevel.NOTICE,
-            EventClassLogLevel.INFO,
-            EventClassLogLevel.DEBUG_SYSTEM,
-            EventClassLogLevel.DEBUG_PROGRAM,
-            EventClassLogLevel.DEBUG_PROCESS,
-            EventClassLogLevel.DEBUG_MODULE,
-            EventClassLogLevel.DEBUG_UNIT,
-            EventClassLogLevel.DEBUG_FUNCTION,
-            EventClassLogLevel.DEBUG_LINE,
-            EventClassLogLevel.DEBUG,
-        )
-
-        if log_level not in log_levels:
+        if log_level not in _EVENT_CLASS_LOG_LEVELS:
             raise ValueError("'{}' is not a valid log level".format(log_level))
 
         ret = native_bt.event_class_set_log_level(self._ptr, log_level)
@@ -27,12 +27,45 @@ import abc
 import bt2
 
 
+# native functions called for each field class, member or mapping while
+# looking up or iterating, or by frequently read properties; bind them
+# once here instead of looking them up in the native_bt module on each
+# call
+_native_fc_get_type_id = native_bt.field_class_get_type_id
+_native_fc_enum_get_mapping_count = native_bt.field_class_enumeration_get_mapping_count
+_native_fc_enum_mapping_iter_next = native_bt.field_class_enumeration_mapping_iterator_next
+_native_fc_enum_mapping_iter_get_signed = native_bt.field_class_enumeration_mapping_iterator_get_signed
+_native_fc_enum_mapping_iter_get_unsigned = native_bt.field_class_enumeration_mapping_iterator_get_unsigned
+_native_fc_struct_get_field_by_index = native_bt.field_class_structure_get_field_by_index
+_native_fc_variant_get_field_by_index = native_bt.field_class_variant_get_field_by_index
+_native_fc_array_get_length = native_bt.field_class_array_get_length
+_native_fc_array_get_element_type = native_bt.field_class_array_get_element_type
+_native_fc_sequence_get_length_field_name = native_bt.field_class_sequence_get_length_field_name
+_native_fc_sequence_get_element_type = native_bt.field_class_sequence_get_element_type
+
+
 def _create_from_ptr(ptr):
-    typeid = native_bt.field_class_get_type_id(ptr)
-    return _TYPE_ID_TO_OBJ[typeid]._create_from_ptr(ptr)
+    typeid = _native_fc_get_type_id(ptr)
+    return _TYPE_ID_TO_CREATE_FROM_PTR[typeid](ptr)
+
+
+# creates the element field class object of the array or sequence field
+# class object `fc`; the element field class of `fc` never changes, so
+# its factory is found from its type ID on the first call only
+def _create_elem_from_ptr(fc, ptr):
+    try:
+        create_from_ptr = fc._elem_create_from_ptr
+    except AttributeError:
+        typeid = _native_fc_get_type_id(ptr)
+        create_from_ptr = _TYPE_ID_TO_CREATE_FROM_PTR[typeid]
+        fc._elem_create_from_ptr = create_from_ptr
+
+    return create_from_ptr(ptr)
 
 
 class _FieldClass(object._Object, metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     def __init__(self, ptr):
         super().__init__(ptr)
 
@@ -80,6 +113,8 @@ class _FieldClass(object._Object, metaclass=abc.ABCMeta):
 
 
 class _AlignmentProp:
+    __slots__ = ()
+
     @property
     def alignment(self):
         alignment = native_bt.field_class_get_alignment(self._ptr)
@@ -94,6 +129,8 @@ class _AlignmentProp:
 
 
 class _ByteOrderProp:
+    __slots__ = ()
+
     @property
     def byte_order(self):
         bo = native_bt.field_class_get_byte_order(self._ptr)
@@ -108,6 +145,7 @@ class _ByteOrderProp:
 
 
 class IntegerFieldClass(_FieldClass, _AlignmentProp, _ByteOrderProp):
+    __slots__ = ()
     _NAME = 'Integer'
 
     def __init__(self, size, alignment=None, byte_order=None, is_signed=None,
@@ -198,6 +236,7 @@ class IntegerFieldClass(_FieldClass, _AlignmentProp, _ByteOrderProp):
 
 
 class FloatingPointNumberFieldClass(_FieldClass, _AlignmentProp, _ByteOrderProp):
+    __slots__ = ()
     _NAME = 'Floating point number'
 
     def __init__(self, alignment=None, byte_order=None, exponent_size=None,
@@ -244,6 +283,8 @@ class FloatingPointNumberFieldClass(_FieldClass, _AlignmentProp, _ByteOrderProp)
 
 
 class _EnumerationFieldClassMapping:
+    __slots__ = ('_name', '_lower', '_upper')
+
     def __init__(self, name, lower, upper):
         self._name = name
         self._lower = lower
@@ -270,6 +311,8 @@ class _EnumerationFieldClassMapping:
 
 class _EnumerationFieldClassMappingIterator(object._Object,
                                            collections.abc.Iterator):
+    __slots__ = ('_is_signed', '_done')
+
     def __init__(self, iter_ptr, is_signed):
         super().__init__(iter_ptr)
         self._is_signed = is_signed
@@ -279,15 +322,15 @@ class _EnumerationFieldClassMappingIterator(object._Object,
         if self._done:
             raise StopIteration
 
-        ret = native_bt.field_class_enumeration_mapping_iterator_next(self._ptr)
+        ret = _native_fc_enum_mapping_iter_next(self._ptr)
         if ret < 0:
             self._done = True
             raise StopIteration
 
         if self._is_signed:
-            ret, name, lower, upper = native_bt.field_class_enumeration_mapping_iterator_get_signed(self._ptr)
+            ret, name, lower, upper = _native_fc_enum_mapping_iter_get_signed(self._ptr)
         else:
-            ret, name, lower, upper = native_bt.field_class_enumeration_mapping_iterator_get_unsigned(self._ptr)
+            ret, name, lower, upper = _native_fc_enum_mapping_iter_get_unsigned(self._ptr)
 
         assert(ret == 0)
         mapping = _EnumerationFieldClassMapping(name, lower, upper)
@@ -296,11 +339,12 @@ class _EnumerationFieldClassMappingIterator(object._Object,
 
 
 class EnumerationFieldClass(IntegerFieldClass, collections.abc.Sequence):
+    __slots__ = ()
     _NAME = 'Enumeration'
 
     def __init__(self, int_field_class=None, size=None, alignment=None,
                  byte_order=None, is_signed=None, base=None, encoding=None,
-                 mapped_clock_class=None):
+                 mapped_clock_class=None, mappings=None):
         if int_field_class is None:
             int_field_class = IntegerFieldClass(size=size, alignment=alignment,
                                               byte_order=byte_order,
@@ -313,6 +357,9 @@ class EnumerationFieldClass(IntegerFieldClass, collections.abc.Sequence):
         self._check_create_status(ptr)
         _FieldClass.__init__(self, ptr)
 
+        if mappings is not None:
+            self.add_mappings(mappings)
+
     @property
     def integer_field_class(self):
         ptr = native_bt.field_class_enumeration_get_container_type(self._ptr)
@@ -372,7 +419,7 @@ class EnumerationFieldClass(IntegerFieldClass, collections.abc.Sequence):
         self.integer_field_class.mapped_clock_class = mapped_clock_class
 
     def __len__(self):
-        count = native_bt.field_class_enumeration_get_mapping_count(self._ptr)
+        count = _native_fc_enum_get_mapping_count(self._ptr)
         assert(count >= 0)
         return count
 
@@ -391,24 +438,39 @@ class EnumerationFieldClass(IntegerFieldClass, collections.abc.Sequence):
         assert(ret == 0)
         return _EnumerationFieldClassMapping(name, lower, upper)
 
+    def __iter__(self):
+        # get the mapping count and the getter once instead of once
+        # per mapping like Sequence.__iter__() would through
+        # __getitem__()
+        if self.is_signed:
+            get_fn = native_bt.field_class_enumeration_get_mapping_signed
+        else:
+            get_fn = native_bt.field_class_enumeration_get_mapping_unsigned
+
+        for index in range(len(self)):
+            ret, name, lower, upper = get_fn(self._ptr, index)
+            assert(ret == 0)
+            yield _EnumerationFieldClassMapping(name, lower, upper)
+
     def _get_mapping_iter(self, iter_ptr):
         return _EnumerationFieldClassMappingIterator(iter_ptr, self.is_signed)
 
     def mappings_by_name(self, name):
         utils._check_str(name)
         iter_ptr = native_bt.field_class_enumeration_find_mappings_by_name(self._ptr, name)
-        print('iter_ptr', iter_ptr)
-        return self._get_mapping_iter(iter_ptr)
+        return list(self._get_mapping_iter(iter_ptr))
 
     def mappings_by_value(self, value):
+        # the matching mappings are all found with a single native call
         if self.is_signed:
             utils._check_int64(value)
-            iter_ptr = native_bt.field_class_enumeration_find_mappings_by_signed_value(self._ptr, value)
+            mappings = native_bt.py3_field_class_signed_enumeration_get_mappings_by_value(self._ptr, value)
         else:
             utils._check_uint64(value)
-            iter_ptr = native_bt.field_class_enumeration_find_mappings_by_unsigned_value(self._ptr, value)
+            mappings = native_bt.py3_field_class_unsigned_enumeration_get_mappings_by_value(self._ptr, value)
 
-        return self._get_mapping_iter(iter_ptr)
+        return [_EnumerationFieldClassMapping(name, lower, upper)
+                for name, lower, upper in mappings]
 
     def add_mapping(self, name, lower, upper=None):
         utils._check_str(name)
@@ -428,14 +490,39 @@ class EnumerationFieldClass(IntegerFieldClass, collections.abc.Sequence):
         ret = add_fn(self._ptr, name, lower, upper)
         utils._handle_ret(ret, "cannot add mapping to enumeration field class object")
 
-    def __iadd__(self, mappings):
-        for mapping in mappings:
-            self.add_mapping(mapping.name, mapping.lower, mapping.upper)
+    def add_mappings(self, mappings):
+        if self.is_signed:
+            add_fn = native_bt.py3_field_class_signed_enumeration_map_ranges
+            check_fn = utils._check_int64
+        else:
+            add_fn = native_bt.py3_field_class_unsigned_enumeration_map_ranges
+            check_fn = utils._check_uint64
 
+        mapping_tuples = []
+
+        for name, lower, upper in mappings:
+            # inlined utils._check_str() to avoid a function call per mapping
+            if not isinstance(name, str):
+                raise TypeError("'{}' is not a 'str' object".format(name.__class__.__name__))
+
+            check_fn(lower)
+            check_fn(upper)
+            mapping_tuples.append((name, lower, upper))
+
+        # all the mappings are added with a single native call; if it
+        # fails partway through, the mappings added before the failing
+        # one remain in the enumeration field class
+        ret = add_fn(self._ptr, mapping_tuples)
+        utils._handle_ret(ret, "cannot add mappings to enumeration field class object")
+
+    def __iadd__(self, mappings):
+        self.add_mappings((mapping.name, mapping.lower, mapping.upper)
+                          for mapping in mappings)
         return self
 
 
 class StringFieldClass(_FieldClass):
+    __slots__ = ()
     _NAME = 'String'
 
     def __init__(self, encoding=None):
@@ -460,6 +547,8 @@ class StringFieldClass(_FieldClass):
 
 
 class _FieldContainer(collections.abc.Mapping):
+    __slots__ = ()
+
     def __len__(self):
         count = self._count()
         assert(count >= 0)
@@ -477,7 +566,8 @@ class _FieldContainer(collections.abc.Mapping):
         return _create_from_ptr(ptr)
 
     def __iter__(self):
-        return self._ITER_CLS(self)
+        # all the names are fetched with a single native call
+        return iter(self._get_field_names())
 
     def append_field(self, name, field_class):
         utils._check_str(name)
@@ -486,9 +576,27 @@ class _FieldContainer(collections.abc.Mapping):
         utils._handle_ret(ret, "cannot add field to {} field class object".format(self._NAME.lower()))
 
     def __iadd__(self, fields):
+        names_and_ptrs = []
+        existing_names = set(self._get_field_names())
+
+        # the checks are inlined (same messages as utils._check_str() and
+        # utils._check_type()) to avoid two function calls per field
         for name, field_class in fields.items():
-            self.append_field(name, field_class)
+            if not isinstance(name, str):
+                raise TypeError("'{}' is not a 'str' object".format(name.__class__.__name__))
+
+            if not isinstance(field_class, _FieldClass):
+                raise TypeError("'{}' is not a '{}' object".format(field_class.__class__.__name__,
+                                                                   _FieldClass))
+
+            if name in existing_names:
+                raise bt2.Error("cannot add fields to {} field class object: duplicate field name '{}'".format(self._NAME.lower(), name))
+
+            names_and_ptrs.append((name, field_class._ptr))
 
+        # all the fields are added with a single native call
+        ret = self._add_fields(names_and_ptrs)
+        utils._handle_ret(ret, "cannot add fields to {} field class object".format(self._NAME.lower()))
         return self
 
     def at_index(self, index):
@@ -496,27 +604,9 @@ class _FieldContainer(collections.abc.Mapping):
         return self._at(index)
 
 
-class _StructureFieldClassFieldIterator(collections.abc.Iterator):
-    def __init__(self, struct_field_class):
-        self._struct_field_class = struct_field_class
-        self._at = 0
-
-    def __next__(self):
-        if self._at == len(self._struct_field_class):
-            raise StopIteration
-
-        get_fc_by_index = native_bt.field_class_structure_get_field_by_index
-        ret, name, field_class_ptr = get_fc_by_index(self._struct_field_class._ptr,
-                                                    self._at)
-        assert(ret == 0)
-        native_bt.put(field_class_ptr)
-        self._at += 1
-        return name
-
-
 class StructureFieldClass(_FieldClass, _FieldContainer, _AlignmentProp):
+    __slots__ = ()
     _NAME = 'Structure'
-    _ITER_CLS = _StructureFieldClassFieldIterator
 
     def __init__(self, min_alignment=None):
         ptr = native_bt.field_class_structure_create()
@@ -529,6 +619,9 @@ class StructureFieldClass(_FieldClass, _FieldContainer, _AlignmentProp):
     def _count(self):
         return native_bt.field_class_structure_get_field_count(self._ptr)
 
+    def _get_field_names(self):
+        return native_bt.py3_field_class_structure_get_member_names(self._ptr)
+
     def _get_field_by_name(self, key):
         return native_bt.field_class_structure_get_field_class_by_name(self._ptr, key)
 
@@ -536,11 +629,15 @@ class StructureFieldClass(_FieldClass, _FieldContainer, _AlignmentProp):
         return native_bt.field_class_structure_add_field(self._ptr, ptr,
                                                         name)
 
+    def _add_fields(self, names_and_ptrs):
+        return native_bt.py3_field_class_structure_append_members(self._ptr,
+                                                                 names_and_ptrs)
+
     def _at(self, index):
         if index < 0 or index >= len(self):
             raise IndexError
 
-        ret, name, field_class_ptr = native_bt.field_class_structure_get_field_by_index(self._ptr, index)
+        ret, name, field_class_ptr = _native_fc_struct_get_field_by_index(self._ptr, index)
         assert(ret == 0)
         return _create_from_ptr(field_class_ptr)
 
@@ -549,26 +646,9 @@ StructureFieldClass.min_alignment = property(fset=StructureFieldClass.alignment.
 StructureFieldClass.alignment = property(fget=StructureFieldClass.alignment.fget)
 
 
-class _VariantFieldClassFieldIterator(collections.abc.Iterator):
-    def __init__(self, variant_field_class):
-        self._variant_field_class = variant_field_class
-        self._at = 0
-
-    def __next__(self):
-        if self._at == len(self._variant_field_class):
-            raise StopIteration
-
-        ret, name, field_class_ptr = native_bt.field_class_variant_get_field_by_index(self._variant_field_class._ptr,
-                                                                                    self._at)
-        assert(ret == 0)
-        native_bt.put(field_class_ptr)
-        self._at += 1
-        return name
-
-
 class VariantFieldClass(_FieldClass, _FieldContainer, _AlignmentProp):
+    __slots__ = ()
     _NAME = 'Variant'
-    _ITER_CLS = _VariantFieldClassFieldIterator
 
     def __init__(self, tag_name, tag_field_class=None):
         utils._check_str(tag_name)
@@ -608,22 +688,30 @@ class VariantFieldClass(_FieldClass, _FieldContainer, _AlignmentProp):
     def _count(self):
         return native_bt.field_class_variant_get_field_count(self._ptr)
 
+    def _get_field_names(self):
+        return native_bt.py3_field_class_variant_get_option_names(self._ptr)
+
     def _get_field_by_name(self, key):
         return native_bt.field_class_variant_get_field_class_by_name(self._ptr, key)
 
     def _add_field(self, ptr, name):
         return native_bt.field_class_variant_add_field(self._ptr, ptr, name)
 
+    def _add_fields(self, names_and_ptrs):
+        return native_bt.py3_field_class_variant_append_options(self._ptr,
+                                                               names_and_ptrs)
+
     def _at(self, index):
         if index < 0 or index >= len(self):
             raise IndexError
 
-        ret, name, field_class_ptr = native_bt.field_class_variant_get_field_by_index(self._ptr, index)
+        ret, name, field_class_ptr = _native_fc_variant_get_field_by_index(self._ptr, index)
         assert(ret == 0)
         return _create_from_ptr(field_class_ptr)
 
 
 class ArrayFieldClass(_FieldClass):
+    __slots__ = ('_elem_create_from_ptr',)
     _NAME = 'Array'
 
     def __init__(self, element_field_class, length):
@@ -635,18 +723,19 @@ class ArrayFieldClass(_FieldClass):
 
     @property
     def length(self):
-        length = native_bt.field_class_array_get_length(self._ptr)
+        length = _native_fc_array_get_length(self._ptr)
         assert(length >= 0)
         return length
 
     @property
     def element_field_class(self):
-        ptr = native_bt.field_class_array_get_element_type(self._ptr)
+        ptr = _native_fc_array_get_element_type(self._ptr)
         assert(ptr)
-        return _create_from_ptr(ptr)
+        return _create_elem_from_ptr(self, ptr)
 
 
 class SequenceFieldClass(_FieldClass):
+    __slots__ = ('_elem_create_from_ptr',)
     _NAME = 'Sequence'
 
     def __init__(self, element_field_class, length_name):
@@ -659,16 +748,23 @@ class SequenceFieldClass(_FieldClass):
 
     @property
     def length_name(self):
-        length_name = native_bt.field_class_sequence_get_length_field_name(self._ptr)
+        length_name = _native_fc_sequence_get_length_field_name(self._ptr)
         assert(length_name is not None)
         return length_name
 
     @property
     def element_field_class(self):
-        ptr = native_bt.field_class_sequence_get_element_type(self._ptr)
+        ptr = _native_fc_sequence_get_element_type(self._ptr)
         assert(ptr)
-        return _create_from_ptr(ptr)
+        return _create_elem_from_ptr(self, ptr)
 
 
 _TYPE_ID_TO_OBJ = {
 }
+
+
+# bound _create_from_ptr() class methods, so that _create_from_ptr() does
+# not need to get the class first and then its method on each call
+_TYPE_ID_TO_CREATE_FROM_PTR = {
+    typeid: cls._create_from_ptr for typeid, cls in _TYPE_ID_TO_OBJ.items()
+}
@@ -34,7 +34,8 @@
 	if (*$1) {
 		PyObject *py_label_list = PyList_New(*$2);
 		for (int i = 0; i < *$2; i++) {
-			PyList_SET_ITEM(py_label_list, i, PyUnicode_FromString((*$1)[i]));
+			PyList_SET_ITEM(py_label_list, i,
+				PyUnicode_InternFromString((*$1)[i]));
 		}
 
 		$result = SWIG_Python_AppendOutput($result, py_label_list);
@@ -318,3 +319,445 @@ bt_field_class_variant_borrow_option_by_name(
 
 extern bt_field_class *bt_field_class_variant_option_borrow_field_class(
 		bt_field_class_variant_option *option);
+
+/* Helper functions for Python */
+%{
+/*
+ * Member, option, and mapping names which these helpers return are
+ * interned: the same metadata is read over and over for each stream,
+ * so the Python-side comparisons and dictionary lookups with those
+ * names can use the interned fast path.
+ */
+
+static PyObject *bt_py3_field_class_structure_get_member_names(
+		const bt_field_class *field_class)
+{
+	uint64_t i;
+	uint64_t member_count =
+		bt_field_class_structure_get_member_count(field_class);
+	PyObject *py_names = PyTuple_New(member_count);
+
+	if (!py_names) {
+		goto error;
+	}
+
+	for (i = 0; i < member_count; i++) {
+		const bt_field_class_structure_member *member =
+			bt_field_class_structure_borrow_member_by_index_const(
+				field_class, i);
+		PyObject *py_name;
+
+		BT_ASSERT(member);
+		py_name = PyUnicode_InternFromString(bt_field_class_structure_member_get_name(member));
+		if (!py_name) {
+			goto error;
+		}
+
+		PyTuple_SET_ITEM(py_names, i, py_name);
+	}
+
+	goto end;
+
+error:
+	Py_XDECREF(py_names);
+	py_names = NULL;
+
+end:
+	return py_names;
+}
+
+static PyObject *bt_py3_field_class_variant_get_option_names(
+		const bt_field_class *field_class)
+{
+	uint64_t i;
+	uint64_t option_count =
+		bt_field_class_variant_get_option_count(field_class);
+	PyObject *py_names = PyTuple_New(option_count);
+
+	if (!py_names) {
+		goto error;
+	}
+
+	for (i = 0; i < option_count; i++) {
+		const bt_field_class_variant_option *option =
+			bt_field_class_variant_borrow_option_by_index_const(
+				field_class, i);
+		PyObject *py_name;
+
+		BT_ASSERT(option);
+		py_name = PyUnicode_InternFromString(bt_field_class_variant_option_get_name(option));
+		if (!py_name) {
+			goto error;
+		}
+
+		PyTuple_SET_ITEM(py_names, i, py_name);
+	}
+
+	goto end;
+
+error:
+	Py_XDECREF(py_names);
+	py_names = NULL;
+
+end:
+	return py_names;
+}
+
+/*
+ * Sets `*name` and `*field_class` to the name and field class of
+ * `py_tuple`, a (name, field class) tuple which the caller already
+ * checked.
+ *
+ * Returns 0 on success, or -1 if the name cannot be converted to UTF-8,
+ * in which case the Python error is cleared.
+ */
+static int bt_py3_field_class_get_name_and_field_class(PyObject *py_tuple,
+		const char **name, bt_field_class **field_class)
+{
+	int ret;
+
+	BT_ASSERT(PyTuple_Check(py_tuple));
+	BT_ASSERT(PyTuple_GET_SIZE(py_tuple) == 2);
+	*name = PyUnicode_AsUTF8(PyTuple_GET_ITEM(py_tuple, 0));
+	if (!*name) {
+		PyErr_Clear();
+		return -1;
+	}
+
+	ret = SWIG_ConvertPtr(PyTuple_GET_ITEM(py_tuple, 1),
+		(void **) field_class, SWIGTYPE_p_bt_field_class, 0);
+	BT_ASSERT(SWIG_IsOK(ret));
+	return 0;
+}
+
+/*
+ * Appends, in order, the members of the list `py_members`, a list of
+ * (name, field class) tuples, to the structure field class
+ * `struct_field_class`.
+ *
+ * Stops at the first member which cannot be appended and returns its
+ * status, or BT_FIELD_CLASS_STATUS_NOMEM if its name cannot be
+ * converted to UTF-8.
+ */
+static bt_field_class_status bt_py3_field_class_structure_append_members(
+		bt_field_class *struct_field_class, PyObject *py_members)
+{
+	Py_ssize_t i;
+	bt_field_class_status status = BT_FIELD_CLASS_STATUS_OK;
+
+	BT_ASSERT(PyList_Check(py_members));
+
+	for (i = 0; i < PyList_GET_SIZE(py_members); i++) {
+		const char *name;
+		bt_field_class *field_class;
+
+		if (bt_py3_field_class_get_name_and_field_class(
+				PyList_GET_ITEM(py_members, i), &name,
+				&field_class)) {
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		status = bt_field_class_structure_append_member(
+			struct_field_class, name, field_class);
+		if (status != BT_FIELD_CLASS_STATUS_OK) {
+			break;
+		}
+	}
+
+	return status;
+}
+
+/*
+ * Appends, in order, the options of the list `py_options`, a list of
+ * (name, field class) tuples, to the variant field class
+ * `var_field_class`.
+ *
+ * Stops at the first option which cannot be appended and returns its
+ * status, or BT_FIELD_CLASS_STATUS_NOMEM if its name cannot be
+ * converted to UTF-8.
+ */
+static bt_field_class_status bt_py3_field_class_variant_append_options(
+		bt_field_class *var_field_class, PyObject *py_options)
+{
+	Py_ssize_t i;
+	bt_field_class_status status = BT_FIELD_CLASS_STATUS_OK;
+
+	BT_ASSERT(PyList_Check(py_options));
+
+	for (i = 0; i < PyList_GET_SIZE(py_options); i++) {
+		const char *name;
+		bt_field_class *field_class;
+
+		if (bt_py3_field_class_get_name_and_field_class(
+				PyList_GET_ITEM(py_options, i), &name,
+				&field_class)) {
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		status = bt_field_class_variant_append_option(
+			var_field_class, name, field_class);
+		if (status != BT_FIELD_CLASS_STATUS_OK) {
+			break;
+		}
+	}
+
+	return status;
+}
+
+/*
+ * Maps, in order, the ranges of the list `py_mappings`, a list of
+ * (label, lower, upper) tuples, in the enumeration field class
+ * `field_class`.
+ *
+ * Stops at the first range which cannot be mapped and returns its
+ * status, or BT_FIELD_CLASS_STATUS_NOMEM if `py_mappings` is not a list
+ * of (label, lower, upper) tuples; the ranges mapped before it remain
+ * mapped.
+ */
+static bt_field_class_status bt_py3_field_class_unsigned_enumeration_map_ranges(
+		bt_field_class *field_class, PyObject *py_mappings)
+{
+	Py_ssize_t i;
+	bt_field_class_status status = BT_FIELD_CLASS_STATUS_OK;
+
+	if (!PyList_Check(py_mappings)) {
+		status = BT_FIELD_CLASS_STATUS_NOMEM;
+		goto end;
+	}
+
+	for (i = 0; i < PyList_GET_SIZE(py_mappings); i++) {
+		PyObject *py_mapping = PyList_GET_ITEM(py_mappings, i);
+		const char *label;
+		uint64_t lower, upper;
+
+		if (!PyTuple_Check(py_mapping) ||
+				PyTuple_GET_SIZE(py_mapping) != 3) {
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		label = PyUnicode_AsUTF8(PyTuple_GET_ITEM(py_mapping, 0));
+		if (!label) {
+			PyErr_Clear();
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		lower = PyLong_AsUnsignedLongLong(PyTuple_GET_ITEM(py_mapping, 1));
+		upper = PyLong_AsUnsignedLongLong(PyTuple_GET_ITEM(py_mapping, 2));
+		if (PyErr_Occurred()) {
+			PyErr_Clear();
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		status = bt_field_class_unsigned_enumeration_map_range(
+			field_class, label, lower, upper);
+		if (status != BT_FIELD_CLASS_STATUS_OK) {
+			break;
+		}
+	}
+
+end:
+	return status;
+}
+
+static bt_field_class_status bt_py3_field_class_signed_enumeration_map_ranges(
+		bt_field_class *field_class, PyObject *py_mappings)
+{
+	Py_ssize_t i;
+	bt_field_class_status status = BT_FIELD_CLASS_STATUS_OK;
+
+	if (!PyList_Check(py_mappings)) {
+		status = BT_FIELD_CLASS_STATUS_NOMEM;
+		goto end;
+	}
+
+	for (i = 0; i < PyList_GET_SIZE(py_mappings); i++) {
+		PyObject *py_mapping = PyList_GET_ITEM(py_mappings, i);
+		const char *label;
+		int64_t lower, upper;
+
+		if (!PyTuple_Check(py_mapping) ||
+				PyTuple_GET_SIZE(py_mapping) != 3) {
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		label = PyUnicode_AsUTF8(PyTuple_GET_ITEM(py_mapping, 0));
+		if (!label) {
+			PyErr_Clear();
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		lower = PyLong_AsLongLong(PyTuple_GET_ITEM(py_mapping, 1));
+		upper = PyLong_AsLongLong(PyTuple_GET_ITEM(py_mapping, 2));
+		if (PyErr_Occurred()) {
+			PyErr_Clear();
+			status = BT_FIELD_CLASS_STATUS_NOMEM;
+			break;
+		}
+
+		status = bt_field_class_signed_enumeration_map_range(
+			field_class, label, lower, upper);
+		if (status != BT_FIELD_CLASS_STATUS_OK) {
+			break;
+		}
+	}
+
+end:
+	return status;
+}
+
+/*
+ * Returns a list of (label, lower, upper) tuples, one for each mapping
+ * range of the enumeration field class `field_class` which contains
+ * `value`, or NULL with a Python error set on failure.
+ */
+static PyObject *bt_py3_field_class_unsigned_enumeration_get_mappings_by_value(
+		const bt_field_class *field_class, uint64_t value)
+{
+	uint64_t i;
+	uint64_t mapping_count =
+		bt_field_class_enumeration_get_mapping_count(field_class);
+	PyObject *py_mappings = PyList_New(0);
+	int ret;
+
+	if (!py_mappings) {
+		goto error;
+	}
+
+	for (i = 0; i < mapping_count; i++) {
+		const bt_field_class_unsigned_enumeration_mapping *mapping =
+			bt_field_class_unsigned_enumeration_borrow_mapping_by_index_const(
+				field_class, i);
+		const bt_field_class_enumeration_mapping *base_mapping =
+			bt_field_class_unsigned_enumeration_mapping_as_mapping_const(
+				mapping);
+		uint64_t range_count =
+			bt_field_class_enumeration_mapping_get_range_count(
+				base_mapping);
+		uint64_t j;
+
+		for (j = 0; j < range_count; j++) {
+			uint64_t lower, upper;
+			PyObject *py_mapping;
+
+			bt_field_class_unsigned_enumeration_mapping_get_range_by_index(
+				mapping, j, &lower, &upper);
+
+			if (value < lower || value > upper) {
+				continue;
+			}
+
+			py_mapping = Py_BuildValue("(NKK)",
+				PyUnicode_InternFromString(
+					bt_field_class_enumeration_mapping_get_label(
+						base_mapping)),
+				(unsigned long long) lower,
+				(unsigned long long) upper);
+			if (!py_mapping) {
+				goto error;
+			}
+
+			ret = PyList_Append(py_mappings, py_mapping);
+			Py_DECREF(py_mapping);
+			if (ret) {
+				goto error;
+			}
+		}
+	}
+
+	goto end;
+
+error:
+	Py_XDECREF(py_mappings);
+	py_mappings = NULL;
+
+end:
+	return py_mappings;
+}
+
+static PyObject *bt_py3_field_class_signed_enumeration_get_mappings_by_value(
+		const bt_field_class *field_class, int64_t value)
+{
+	uint64_t i;
+	uint64_t mapping_count =
+		bt_field_class_enumeration_get_mapping_count(field_class);
+	PyObject *py_mappings = PyList_New(0);
+	int ret;
+
+	if (!py_mappings) {
+		goto error;
+	}
+
+	for (i = 0; i < mapping_count; i++) {
+		const bt_field_class_signed_enumeration_mapping *mapping =
+			bt_field_class_signed_enumeration_borrow_mapping_by_index_const(
+				field_class, i);
+		const bt_field_class_enumeration_mapping *base_mapping =
+			bt_field_class_signed_enumeration_mapping_as_mapping_const(
+				mapping);
+		uint64_t range_count =
+			bt_field_class_enumeration_mapping_get_range_count(
+				base_mapping);
+		uint64_t j;
+
+		for (j = 0; j < range_count; j++) {
+			int64_t lower, upper;
+			PyObject *py_mapping;
+
+			bt_field_class_signed_enumeration_mapping_get_range_by_index(
+				mapping, j, &lower, &upper);
+
+			if (value < lower || value > upper) {
+				continue;
+			}
+
+			py_mapping = Py_BuildValue("(NLL)",
+				PyUnicode_InternFromString(
+					bt_field_class_enumeration_mapping_get_label(
+						base_mapping)),
+				(long long) lower, (long long) upper);
+			if (!py_mapping) {
+				goto error;
+			}
+
+			ret = PyList_Append(py_mappings, py_mapping);
+			Py_DECREF(py_mapping);
+			if (ret) {
+				goto error;
+			}
+		}
+	}
+
+	goto end;
+
+error:
+	Py_XDECREF(py_mappings);
+	py_mappings = NULL;
+
+end:
+	return py_mappings;
+}
+%}
+
+PyObject *bt_py3_field_class_structure_get_member_names(
+		const bt_field_class *field_class);
+PyObject *bt_py3_field_class_variant_get_option_names(
+		const bt_field_class *field_class);
+PyObject *bt_py3_field_class_unsigned_enumeration_get_mappings_by_value(
+		const bt_field_class *field_class, uint64_t value);
+PyObject *bt_py3_field_class_signed_enumeration_get_mappings_by_value(
+		const bt_field_class *field_class, int64_t value);
+bt_field_class_status bt_py3_field_class_structure_append_members(
+		bt_field_class *struct_field_class, PyObject *py_members);
+bt_field_class_status bt_py3_field_class_variant_append_options(
+		bt_field_class *var_field_class, PyObject *py_options);
+bt_field_class_status bt_py3_field_class_unsigned_enumeration_map_ranges(
+		bt_field_class *field_class, PyObject *py_mappings);
+bt_field_class_status bt_py3_field_class_signed_enumeration_map_ranges(
+		bt_field_class *field_class, PyObject *py_mappings);
@@ -25,6 +25,8 @@ import abc
 
 
 class _Object:
+    __slots__ = ('_ptr', '__weakref__')
+
     def __init__(self, ptr):
         self._ptr = ptr
 
@@ -53,6 +55,8 @@ class _Object:
 
 
 class _PrivateObject:
+    __slots__ = ()
+
     def __del__(self):
         pub_ptr = getattr(self, '_pub_ptr', None)
         native_bt.put(pub_ptr)
@@ -61,6 +65,8 @@ class _PrivateObject:
 
 
 class _Freezable(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @property
     def is_frozen(self):
         return self._is_frozen()
@@ -7,13 +7,35 @@ import bt2
 
 @unittest.skip("this is broken")
 class EventTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._ec_cache = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._ec_cache
+
     def setUp(self):
-        self._ec = self._create_ec()
+        self._ec = self._get_ec()
 
     def tearDown(self):
         del self._ec
 
-    def _create_ec(self, with_eh=True, with_sec=True, with_ec=True, with_ep=True):
+    # Returns an event class shared by all the tests of this test case
+    # which only create events from it. Tests which add its stream
+    # class to a trace must create their own with _create_ec().
+    @classmethod
+    def _get_ec(cls, with_eh=True, with_sec=True, with_ec=True, with_ep=True):
+        key = (with_eh, with_sec, with_ec, with_ep)
+
+        if key not in cls._ec_cache:
+            cls._ec_cache[key] = cls._create_ec(with_eh, with_sec, with_ec,
+                                                with_ep)
+
+        return cls._ec_cache[key]
+
+    @staticmethod
+    def _create_ec(with_eh=True, with_sec=True, with_ec=True, with_ep=True):
         # event header
         if with_eh:
             eh = bt2.StructureFieldClass()
@@ -120,7 +142,7 @@ class EventTestCase(unittest.TestCase):
         self.assertEqual(ev.stream_event_context_field['stuff'], 19.19)
 
     def test_no_stream_event_context(self):
-        ec = self._create_ec(with_sec=False)
+        ec = self._get_ec(with_sec=False)
         ev = ec()
         self.assertIsNone(ev.stream_event_context_field)
 
@@ -141,7 +163,7 @@ class EventTestCase(unittest.TestCase):
         self.assertEqual(ev.context_field['msg'], 'hi there')
 
     def test_no_event_context(self):
-        ec = self._create_ec(with_ec=False)
+        ec = self._get_ec(with_ec=False)
         ev = ec()
         self.assertIsNone(ev.context_field)
 
@@ -166,20 +188,22 @@ class EventTestCase(unittest.TestCase):
         self.assertEqual(ev.payload_field['mosquito'], 17)
 
     def test_clock_snapshot(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev = self._ec()
+        ev = ec()
         ev.clock_snapshots.add(cc(177))
         self.assertEqual(ev.clock_snapshots[cc].cycles, 177)
 
     def test_no_clock_snapshot(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev = self._ec()
+        ev = ec()
         self.assertIsNone(ev.clock_snapshots[cc])
 
     def test_no_packet(self):
@@ -187,14 +211,15 @@ class EventTestCase(unittest.TestCase):
         self.assertIsNone(ev.packet)
 
     def test_packet(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
         tc.packet_header_field_class = bt2.StructureFieldClass()
         tc.packet_header_field_class.append_field('magic', bt2.IntegerFieldClass(32))
         tc.packet_header_field_class.append_field('stream_id', bt2.IntegerFieldClass(16))
-        tc.add_stream_class(self._ec.stream_class)
-        ev = self._ec()
+        tc.add_stream_class(ec.stream_class)
+        ev = ec()
         self._fill_ev(ev)
-        stream = self._ec.stream_class()
+        stream = ec.stream_class()
         packet = stream.create_packet()
         packet.header_field['magic'] = 0xc1fc1fc1
         packet.header_field['stream_id'] = 0
@@ -208,14 +233,15 @@ class EventTestCase(unittest.TestCase):
         self.assertIsNone(ev.stream)
 
     def test_stream(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
         tc.packet_header_field_class = bt2.StructureFieldClass()
         tc.packet_header_field_class.append_field('magic', bt2.IntegerFieldClass(32))
         tc.packet_header_field_class.append_field('stream_id', bt2.IntegerFieldClass(16))
-        tc.add_stream_class(self._ec.stream_class)
-        ev = self._ec()
+        tc.add_stream_class(ec.stream_class)
+        ev = ec()
         self._fill_ev(ev)
-        stream = self._ec.stream_class()
+        stream = ec.stream_class()
         packet = stream.create_packet()
         packet.header_field['magic'] = 0xc1fc1fc1
         packet.header_field['stream_id'] = 0
@@ -236,24 +262,26 @@ class EventTestCase(unittest.TestCase):
         ev.payload_field['mosquito'] = 42
 
     def _get_full_ev(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev = self._ec()
+        ev = ec()
         self._fill_ev(ev)
         ev.clock_snapshots.add(cc(234))
         return ev
 
     def test_getitem(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
         tc.packet_header_field_class = bt2.StructureFieldClass()
         tc.packet_header_field_class.append_field('magic', bt2.IntegerFieldClass(32))
         tc.packet_header_field_class.append_field('stream_id', bt2.IntegerFieldClass(16))
-        tc.add_stream_class(self._ec.stream_class)
-        ev = self._ec()
+        tc.add_stream_class(ec.stream_class)
+        ev = ec()
         self._fill_ev(ev)
-        stream = self._ec.stream_class()
+        stream = ec.stream_class()
         packet = stream.create_packet()
         packet.header_field['magic'] = 0xc1fc1fc1
         packet.header_field['stream_id'] = 0
@@ -264,88 +292,96 @@ class EventTestCase(unittest.TestCase):
             ev['magic']
 
         ev.packet = packet
-        self.assertEqual(ev['mosquito'], 42)
-        self.assertEqual(ev['gnu'], 23)
-        self.assertEqual(ev['giraffe'], 1)
-        self.assertEqual(ev['msg'], 'hellooo')
-        self.assertEqual(ev['ant'], -1)
-        self.assertEqual(ev['stuff'], 13.194)
-        self.assertEqual(ev['cpu_id'], 1)
-        self.assertEqual(ev['ts'], 1234)
-        self.assertEqual(ev['id'], 23)
-        self.assertEqual(ev['something_else'], 17.2)
-        self.assertEqual(ev['something'], 154)
-        self.assertEqual(ev['stream_id'], 0)
-        self.assertEqual(ev['magic'], 0xc1fc1fc1)
+        expected = {
+            'mosquito': 42,
+            'gnu': 23,
+            'giraffe': 1,
+            'msg': 'hellooo',
+            'ant': -1,
+            'stuff': 13.194,
+            'cpu_id': 1,
+            'ts': 1234,
+            'id': 23,
+            'something_else': 17.2,
+            'something': 154,
+            'stream_id': 0,
+            'magic': 0xc1fc1fc1,
+        }
+        self.assertEqual({name: ev[name] for name in expected}, expected)
 
         with self.assertRaises(KeyError):
             ev['yes']
 
     def test_eq(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev1 = self._ec()
+        ev1 = ec()
         self._fill_ev(ev1)
         ev1.clock_snapshots.add(cc(234))
-        ev2 = self._ec()
+        ev2 = ec()
         self._fill_ev(ev2)
         ev2.clock_snapshots.add(cc(234))
         self.assertEqual(ev1, ev2)
 
     def test_ne_header_field(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev1 = self._ec()
+        ev1 = ec()
         self._fill_ev(ev1)
         ev1.header_field['id'] = 19
         ev1.clock_snapshots.add(cc(234))
-        ev2 = self._ec()
+        ev2 = ec()
         self._fill_ev(ev2)
         ev2.clock_snapshots.add(cc(234))
         self.assertNotEqual(ev1, ev2)
 
     def test_ne_stream_event_context_field(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev1 = self._ec()
+        ev1 = ec()
         self._fill_ev(ev1)
         ev1.stream_event_context_field['cpu_id'] = 3
         ev1.clock_snapshots.add(cc(234))
-        ev2 = self._ec()
+        ev2 = ec()
         self._fill_ev(ev2)
         ev2.clock_snapshots.add(cc(234))
         self.assertNotEqual(ev1, ev2)
 
     def test_ne_context_field(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev1 = self._ec()
+        ev1 = ec()
         self._fill_ev(ev1)
         ev1.context_field['ant'] = -3
         ev1.clock_snapshots.add(cc(234))
-        ev2 = self._ec()
+        ev2 = ec()
         self._fill_ev(ev2)
         ev2.clock_snapshots.add(cc(234))
         self.assertNotEqual(ev1, ev2)
 
     def test_ne_payload_field(self):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev1 = self._ec()
+        ev1 = ec()
         self._fill_ev(ev1)
         ev1.payload_field['mosquito'] = 98
         ev1.clock_snapshots.add(cc(234))
-        ev2 = self._ec()
+        ev2 = ec()
         self._fill_ev(ev2)
         ev2.clock_snapshots.add(cc(234))
         self.assertNotEqual(ev1, ev2)
@@ -355,11 +391,12 @@ class EventTestCase(unittest.TestCase):
         self.assertFalse(ev == 23)
 
     def _test_copy(self, func):
+        ec = self._create_ec()
         tc = bt2.Trace()
-        tc.add_stream_class(self._ec.stream_class)
+        tc.add_stream_class(ec.stream_class)
         cc = bt2.ClockClass('hi', 1000)
         tc.add_clock_class(cc)
-        ev = self._ec()
+        ev = ec()
         self._fill_ev(ev)
         ev.clock_snapshots.add(cc(234))
         cpy = func(ev)
@@ -4,7 +4,6 @@ import unittest
 import numbers
 import math
 import copy
-import itertools
 import bt2
 
 
@@ -37,6 +36,15 @@ class _TestNumericField(_TestCopySimple):
         if isinstance(rhs, (bt2.field._IntegerField, bt2.field._FloatingPointNumberField)):
             comp_value = copy.copy(rhs)
 
+        if op in _BITWISE_OPS and (isinstance(self._def_value, float) or
+                                   isinstance(rhs, float)):
+            # known to be invalid: no need to run the operation on the
+            # Python value to get the exception type to expect
+            with self.assertRaises(TypeError):
+                op(self._def, rhs)
+
+            return None, None
+
         try:
             r = op(self._def, rhs)
         except Exception as e:
@@ -61,6 +69,13 @@ class _TestNumericField(_TestCopySimple):
         rexc = None
         rvexc = None
 
+        if op in _BITWISE_OPS and isinstance(self._def_value, float):
+            # known to be invalid (see _binop())
+            with self.assertRaises(TypeError):
+                op(self._def)
+
+            return None, None
+
         try:
             r = op(self._def)
         except Exception as e:
@@ -103,7 +118,12 @@ class _TestNumericField(_TestCopySimple):
         self.assertEqual(self._def.addr, addr_before)
 
     def _test_unaryop_value_same(self, op):
-        value_before = copy.copy(self._def_value)
+        value_before = self._def_value
+
+        # numeric Python values are immutable: only copy anything else
+        if not isinstance(value_before, (bool, int, float)):
+            value_before = copy.copy(value_before)
+
         self._unaryop(op)
         self.assertEqual(self._def, value_before)
 
@@ -138,9 +158,6 @@ class _TestNumericField(_TestCopySimple):
         self.assertEqual(self._def, value_before)
 
     def _test_binop_invalid_unknown(self, op):
-        if op in _COMP_BINOPS:
-            self.skipTest('not testing')
-
         class A:
             pass
 
@@ -148,9 +165,6 @@ class _TestNumericField(_TestCopySimple):
             op(self._def, A())
 
     def _test_binop_invalid_none(self, op):
-        if op in _COMP_BINOPS:
-            self.skipTest('not testing')
-
         with self.assertRaises(TypeError):
             op(self._def, None)
 
@@ -202,300 +216,6 @@ class _TestNumericField(_TestCopySimple):
         with self.assertRaises(TypeError):
             op(self._def, None)
 
-    def _test_binop_rhs_false(self, test_cb, op):
-        test_cb(op, False)
-
-    def _test_binop_rhs_true(self, test_cb, op):
-        test_cb(op, True)
-
-    def _test_binop_rhs_pos_int(self, test_cb, op):
-        test_cb(op, 2)
-
-    def _test_binop_rhs_neg_int(self, test_cb, op):
-        test_cb(op, -23)
-
-    def _test_binop_rhs_zero_int(self, test_cb, op):
-        test_cb(op, 0)
-
-    def _test_binop_rhs_pos_vint(self, test_cb, op):
-        test_cb(op, bt2.create_value(2))
-
-    def _test_binop_rhs_neg_vint(self, test_cb, op):
-        test_cb(op, bt2.create_value(-23))
-
-    def _test_binop_rhs_zero_vint(self, test_cb, op):
-        test_cb(op, bt2.create_value(0))
-
-    def _test_binop_rhs_pos_float(self, test_cb, op):
-        test_cb(op, 2.2)
-
-    def _test_binop_rhs_neg_float(self, test_cb, op):
-        test_cb(op, -23.4)
-
-    def _test_binop_rhs_zero_float(self, test_cb, op):
-        test_cb(op, 0.0)
-
-    def _test_binop_rhs_pos_vfloat(self, test_cb, op):
-        test_cb(op, bt2.create_value(2.2))
-
-    def _test_binop_rhs_neg_vfloat(self, test_cb, op):
-        test_cb(op, bt2.create_value(-23.4))
-
-    def _test_binop_rhs_zero_vfloat(self, test_cb, op):
-        test_cb(op, bt2.create_value(0.0))
-
-    def _test_binop_type_false(self, op):
-        self._test_binop_rhs_false(self._test_binop_type, op)
-
-    def _test_binop_type_true(self, op):
-        self._test_binop_rhs_true(self._test_binop_type, op)
-
-    def _test_binop_type_pos_int(self, op):
-        self._test_binop_rhs_pos_int(self._test_binop_type, op)
-
-    def _test_binop_type_neg_int(self, op):
-        self._test_binop_rhs_neg_int(self._test_binop_type, op)
-
-    def _test_binop_type_zero_int(self, op):
-        self._test_binop_rhs_zero_int(self._test_binop_type, op)
-
-    def _test_binop_type_pos_vint(self, op):
-        self._test_binop_rhs_pos_vint(self._test_binop_type, op)
-
-    def _test_binop_type_neg_vint(self, op):
-        self._test_binop_rhs_neg_vint(self._test_binop_type, op)
-
-    def _test_binop_type_zero_vint(self, op):
-        self._test_binop_rhs_zero_vint(self._test_binop_type, op)
-
-    def _test_binop_type_pos_float(self, op):
-        self._test_binop_rhs_pos_float(self._test_binop_type, op)
-
-    def _test_binop_type_neg_float(self, op):
-        self._test_binop_rhs_neg_float(self._test_binop_type, op)
-
-    def _test_binop_type_zero_float(self, op):
-        self._test_binop_rhs_zero_float(self._test_binop_type, op)
-
-    def _test_binop_type_pos_vfloat(self, op):
-        self._test_binop_rhs_pos_vfloat(self._test_binop_type, op)
-
-    def _test_binop_type_neg_vfloat(self, op):
-        self._test_binop_rhs_neg_vfloat(self._test_binop_type, op)
-
-    def _test_binop_type_zero_vfloat(self, op):
-        self._test_binop_rhs_zero_vfloat(self._test_binop_type, op)
-
-    def _test_binop_value_false(self, op):
-        self._test_binop_rhs_false(self._test_binop_value, op)
-
-    def _test_binop_value_true(self, op):
-        self._test_binop_rhs_true(self._test_binop_value, op)
-
-    def _test_binop_value_pos_int(self, op):
-        self._test_binop_rhs_pos_int(self._test_binop_value, op)
-
-    def _test_binop_value_neg_int(self, op):
-        self._test_binop_rhs_neg_int(self._test_binop_value, op)
-
-    def _test_binop_value_zero_int(self, op):
-        self._test_binop_rhs_zero_int(self._test_binop_value, op)
-
-    def _test_binop_value_pos_vint(self, op):
-        self._test_binop_rhs_pos_vint(self._test_binop_value, op)
-
-    def _test_binop_value_neg_vint(self, op):
-        self._test_binop_rhs_neg_vint(self._test_binop_value, op)
-
-    def _test_binop_value_zero_vint(self, op):
-        self._test_binop_rhs_zero_vint(self._test_binop_value, op)
-
-    def _test_binop_value_pos_float(self, op):
-        self._test_binop_rhs_pos_float(self._test_binop_value, op)
-
-    def _test_binop_value_neg_float(self, op):
-        self._test_binop_rhs_neg_float(self._test_binop_value, op)
-
-    def _test_binop_value_zero_float(self, op):
-        self._test_binop_rhs_zero_float(self._test_binop_value, op)
-
-    def _test_binop_value_pos_vfloat(self, op):
-        self._test_binop_rhs_pos_vfloat(self._test_binop_value, op)
-
-    def _test_binop_value_neg_vfloat(self, op):
-        self._test_binop_rhs_neg_vfloat(self._test_binop_value, op)
-
-    def _test_binop_value_zero_vfloat(self, op):
-        self._test_binop_rhs_zero_vfloat(self._test_binop_value, op)
-
-    def _test_binop_lhs_addr_same_false(self, op):
-        self._test_binop_rhs_false(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_true(self, op):
-        self._test_binop_rhs_true(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_pos_int(self, op):
-        self._test_binop_rhs_pos_int(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_neg_int(self, op):
-        self._test_binop_rhs_neg_int(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_zero_int(self, op):
-        self._test_binop_rhs_zero_int(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_pos_vint(self, op):
-        self._test_binop_rhs_pos_vint(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_neg_vint(self, op):
-        self._test_binop_rhs_neg_vint(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_zero_vint(self, op):
-        self._test_binop_rhs_zero_vint(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_pos_float(self, op):
-        self._test_binop_rhs_pos_float(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_neg_float(self, op):
-        self._test_binop_rhs_neg_float(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_zero_float(self, op):
-        self._test_binop_rhs_zero_float(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_pos_vfloat(self, op):
-        self._test_binop_rhs_pos_vfloat(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_neg_vfloat(self, op):
-        self._test_binop_rhs_neg_vfloat(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_addr_same_zero_vfloat(self, op):
-        self._test_binop_rhs_zero_vfloat(self._test_binop_lhs_addr_same, op)
-
-    def _test_binop_lhs_value_same_false(self, op):
-        self._test_binop_rhs_false(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_true(self, op):
-        self._test_binop_rhs_true(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_pos_int(self, op):
-        self._test_binop_rhs_pos_int(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_neg_int(self, op):
-        self._test_binop_rhs_neg_int(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_zero_int(self, op):
-        self._test_binop_rhs_zero_int(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_pos_vint(self, op):
-        self._test_binop_rhs_pos_vint(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_neg_vint(self, op):
-        self._test_binop_rhs_neg_vint(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_zero_vint(self, op):
-        self._test_binop_rhs_zero_vint(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_pos_float(self, op):
-        self._test_binop_rhs_pos_float(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_neg_float(self, op):
-        self._test_binop_rhs_neg_float(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_zero_float(self, op):
-        self._test_binop_rhs_zero_float(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_pos_vfloat(self, op):
-        self._test_binop_rhs_pos_vfloat(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_neg_vfloat(self, op):
-        self._test_binop_rhs_neg_vfloat(self._test_binop_lhs_value_same, op)
-
-    def _test_binop_lhs_value_same_zero_vfloat(self, op):
-        self._test_binop_rhs_zero_vfloat(self._test_binop_lhs_value_same, op)
-
-    def _test_ibinop_type_false(self, op):
-        self._test_binop_rhs_false(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_true(self, op):
-        self._test_binop_rhs_true(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_pos_int(self, op):
-        self._test_binop_rhs_pos_int(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_neg_int(self, op):
-        self._test_binop_rhs_neg_int(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_zero_int(self, op):
-        self._test_binop_rhs_zero_int(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_pos_vint(self, op):
-        self._test_binop_rhs_pos_vint(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_neg_vint(self, op):
-        self._test_binop_rhs_neg_vint(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_zero_vint(self, op):
-        self._test_binop_rhs_zero_vint(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_pos_float(self, op):
-        self._test_binop_rhs_pos_float(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_neg_float(self, op):
-        self._test_binop_rhs_neg_float(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_zero_float(self, op):
-        self._test_binop_rhs_zero_float(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_pos_vfloat(self, op):
-        self._test_binop_rhs_pos_vfloat(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_neg_vfloat(self, op):
-        self._test_binop_rhs_neg_vfloat(self._test_ibinop_type, op)
-
-    def _test_ibinop_type_zero_vfloat(self, op):
-        self._test_binop_rhs_zero_vfloat(self._test_ibinop_type, op)
-
-    def _test_ibinop_value_false(self, op):
-        self._test_binop_rhs_false(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_true(self, op):
-        self._test_binop_rhs_true(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_pos_int(self, op):
-        self._test_binop_rhs_pos_int(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_neg_int(self, op):
-        self._test_binop_rhs_neg_int(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_zero_int(self, op):
-        self._test_binop_rhs_zero_int(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_pos_vint(self, op):
-        self._test_binop_rhs_pos_vint(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_neg_vint(self, op):
-        self._test_binop_rhs_neg_vint(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_zero_vint(self, op):
-        self._test_binop_rhs_zero_vint(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_pos_float(self, op):
-        self._test_binop_rhs_pos_float(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_neg_float(self, op):
-        self._test_binop_rhs_neg_float(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_zero_float(self, op):
-        self._test_binop_rhs_zero_float(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_pos_vfloat(self, op):
-        self._test_binop_rhs_pos_vfloat(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_neg_vfloat(self, op):
-        self._test_binop_rhs_neg_vfloat(self._test_ibinop_value, op)
-
-    def _test_ibinop_value_zero_vfloat(self, op):
-        self._test_binop_rhs_zero_vfloat(self._test_ibinop_value, op)
-
     def test_bool_op(self):
         self.assertEqual(bool(self._def), bool(self._def_value))
 
@@ -535,6 +255,55 @@ class _TestNumericField(_TestCopySimple):
         self.assertEqual(other, field)
 
 
+# reflected binary operations
+def _radd(a, b):
+    return operator.add(b, a)
+
+
+def _rand(a, b):
+    return operator.and_(b, a)
+
+
+def _rfloordiv(a, b):
+    return operator.floordiv(b, a)
+
+
+def _rlshift(a, b):
+    return operator.lshift(b, a)
+
+
+def _rmod(a, b):
+    return operator.mod(b, a)
+
+
+def _rmul(a, b):
+    return operator.mul(b, a)
+
+
+def _ror(a, b):
+    return operator.or_(b, a)
+
+
+def _rpow(a, b):
+    return operator.pow(b, a)
+
+
+def _rrshift(a, b):
+    return operator.rshift(b, a)
+
+
+def _rsub(a, b):
+    return operator.sub(b, a)
+
+
+def _rtruediv(a, b):
+    return operator.truediv(b, a)
+
+
+def _rxor(a, b):
+    return operator.xor(b, a)
+
+
 _BINOPS = (
     ('lt', operator.lt),
     ('le', operator.le),
@@ -543,29 +312,29 @@ _BINOPS = (
     ('ge', operator.ge),
     ('gt', operator.gt),
     ('add', operator.add),
-    ('radd', lambda a, b: operator.add(b, a)),
+    ('radd', _radd),
     ('and', operator.and_),
-    ('rand', lambda a, b: operator.and_(b, a)),
+    ('rand', _rand),
     ('floordiv', operator.floordiv),
-    ('rfloordiv', lambda a, b: operator.floordiv(b, a)),
+    ('rfloordiv', _rfloordiv),
     ('lshift', operator.lshift),
-    ('rlshift', lambda a, b: operator.lshift(b, a)),
+    ('rlshift', _rlshift),
     ('mod', operator.mod),
-    ('rmod', lambda a, b: operator.mod(b, a)),
+    ('rmod', _rmod),
     ('mul', operator.mul),
-    ('rmul', lambda a, b: operator.mul(b, a)),
+    ('rmul', _rmul),
     ('or', operator.or_),
-    ('ror', lambda a, b: operator.or_(b, a)),
+    ('ror', _ror),
     ('pow', operator.pow),
-    ('rpow', lambda a, b: operator.pow(b, a)),
+    ('rpow', _rpow),
     ('rshift', operator.rshift),
-    ('rrshift', lambda a, b: operator.rshift(b, a)),
+    ('rrshift', _rrshift),
     ('sub', operator.sub),
-    ('rsub', lambda a, b: operator.sub(b, a)),
+    ('rsub', _rsub),
     ('truediv', operator.truediv),
-    ('rtruediv', lambda a, b: operator.truediv(b, a)),
+    ('rtruediv', _rtruediv),
     ('xor', operator.xor),
-    ('rxor', lambda a, b: operator.xor(b, a)),
+    ('rxor', _rxor),
 )
 
 
@@ -585,6 +354,14 @@ _IBINOPS = (
 )
 
 
+# bitwise operations, which always raise `TypeError` when one of their
+# operands is a floating point number
+_BITWISE_OPS = frozenset([op for name, op in _BINOPS + _IBINOPS if name in (
+    'and', 'rand', 'lshift', 'rlshift', 'or', 'ror', 'rshift', 'rrshift',
+    'xor', 'rxor', 'iand', 'ilshift', 'ior', 'irshift', 'ixor',
+)] + [operator.invert])
+
+
 _UNARYOPS = (
     ('neg', operator.neg),
     ('pos', operator.pos),
@@ -601,116 +378,98 @@ _UNARYOPS = (
 )
 
 
-def _inject_numeric_testing_methods(cls):
-    def test_binop_name(suffix):
-        return 'test_binop_{}_{}'.format(name, suffix)
+# right-hand side operands with which each binary operation is tested:
+# (kind, raw value, whether to wrap the raw value in a value object)
+_BINOP_RHS = (
+    ('false', False, False),
+    ('true', True, False),
+    ('pos_int', 2, False),
+    ('neg_int', -23, False),
+    ('zero_int', 0, False),
+    ('pos_vint', 2, True),
+    ('neg_vint', -23, True),
+    ('zero_vint', 0, True),
+    ('pos_float', 2.2, False),
+    ('neg_float', -23.4, False),
+    ('zero_float', 0.0, False),
+    ('pos_vfloat', 2.2, True),
+    ('neg_vfloat', -23.4, True),
+    ('zero_vfloat', 0.0, True),
+)
+
+
+# value object operands, created on first use and then shared by all
+# the tests (no binary operation modifies its right-hand side operand);
+# keyed by kind because 0 and 0.0 are equal dictionary keys
+_binop_rhs_value_objs = {}
+
+
+def _get_binop_rhs(rhs_kind, raw_value, is_value_obj):
+    if not is_value_obj:
+        return raw_value
+
+    value_obj = _binop_rhs_value_objs.get(rhs_kind)
 
-    def test_ibinop_name(suffix):
-        return 'test_ibinop_{}_{}'.format(name, suffix)
+    if value_obj is None:
+        value_obj = bt2.create_value(raw_value)
+        _binop_rhs_value_objs[rhs_kind] = value_obj
 
-    def test_unaryop_name(suffix):
-        return 'test_unaryop_{}_{}'.format(name, suffix)
+    return value_obj
 
-    # inject testing methods for each binary operation
+
+def _inject_numeric_testing_methods(cls):
+    # One testing method is injected for each operation. It runs all the
+    # checks of this operation, with all the kinds of right-hand side
+    # operands, as subtests, instead of having one testing method, and
+    # thus one setUp()/tearDown() pass, per check and operand kind.
+    def test_binop(self, op):
+        # comparing a field to an unknown object or to `None` is valid
+        if op not in _COMP_BINOPS:
+            for check in ('_test_binop_invalid_unknown',
+                          '_test_binop_invalid_none'):
+                with self.subTest(check=check):
+                    getattr(self, check)(op)
+
+        for check in ('_test_binop_type', '_test_binop_value',
+                      '_test_binop_lhs_addr_same',
+                      '_test_binop_lhs_value_same'):
+            for rhs_kind, raw_value, is_value_obj in _BINOP_RHS:
+                with self.subTest(check=check, rhs=rhs_kind):
+                    rhs = _get_binop_rhs(rhs_kind, raw_value, is_value_obj)
+                    getattr(self, check)(op, rhs)
+
+    def test_ibinop(self, op):
+        for check in ('_test_ibinop_invalid_unknown',
+                      '_test_ibinop_invalid_none'):
+            with self.subTest(check=check):
+                getattr(self, check)(op)
+
+        for check in ('_test_ibinop_type', '_test_ibinop_value'):
+            for rhs_kind, raw_value, is_value_obj in _BINOP_RHS:
+                with self.subTest(check=check, rhs=rhs_kind):
+                    # an inplace operation modifies the field object:
+                    # start each check with a fresh one
+                    self._def = self._create_def()
+                    rhs = _get_binop_rhs(rhs_kind, raw_value, is_value_obj)
+                    getattr(self, check)(op, rhs)
+
+    def test_unaryop(self, op):
+        for check in ('_test_unaryop_type', '_test_unaryop_value',
+                      '_test_unaryop_addr_same', '_test_unaryop_value_same'):
+            with self.subTest(check=check):
+                getattr(self, check)(op)
+
+    # inject a testing method for each binary operation
     for name, binop in _BINOPS:
-        setattr(cls, test_binop_name('invalid_unknown'), partialmethod(_TestNumericField._test_binop_invalid_unknown, op=binop))
-        setattr(cls, test_binop_name('invalid_none'), partialmethod(_TestNumericField._test_binop_invalid_none, op=binop))
-        setattr(cls, test_binop_name('type_true'), partialmethod(_TestNumericField._test_binop_type_true, op=binop))
-        setattr(cls, test_binop_name('type_pos_int'), partialmethod(_TestNumericField._test_binop_type_pos_int, op=binop))
-        setattr(cls, test_binop_name('type_pos_vint'), partialmethod(_TestNumericField._test_binop_type_pos_vint, op=binop))
-        setattr(cls, test_binop_name('value_true'), partialmethod(_TestNumericField._test_binop_value_true, op=binop))
-        setattr(cls, test_binop_name('value_pos_int'), partialmethod(_TestNumericField._test_binop_value_pos_int, op=binop))
-        setattr(cls, test_binop_name('value_pos_vint'), partialmethod(_TestNumericField._test_binop_value_pos_vint, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_true'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_true, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_pos_int'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_pos_int, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_pos_vint'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_pos_vint, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_true'), partialmethod(_TestNumericField._test_binop_lhs_value_same_true, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_pos_int'), partialmethod(_TestNumericField._test_binop_lhs_value_same_pos_int, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_pos_vint'), partialmethod(_TestNumericField._test_binop_lhs_value_same_pos_vint, op=binop))
-        setattr(cls, test_binop_name('type_neg_int'), partialmethod(_TestNumericField._test_binop_type_neg_int, op=binop))
-        setattr(cls, test_binop_name('type_neg_vint'), partialmethod(_TestNumericField._test_binop_type_neg_vint, op=binop))
-        setattr(cls, test_binop_name('value_neg_int'), partialmethod(_TestNumericField._test_binop_value_neg_int, op=binop))
-        setattr(cls, test_binop_name('value_neg_vint'), partialmethod(_TestNumericField._test_binop_value_neg_vint, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_neg_int'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_neg_int, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_neg_vint'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_neg_vint, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_neg_int'), partialmethod(_TestNumericField._test_binop_lhs_value_same_neg_int, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_neg_vint'), partialmethod(_TestNumericField._test_binop_lhs_value_same_neg_vint, op=binop))
-        setattr(cls, test_binop_name('type_false'), partialmethod(_TestNumericField._test_binop_type_false, op=binop))
-        setattr(cls, test_binop_name('type_zero_int'), partialmethod(_TestNumericField._test_binop_type_zero_int, op=binop))
-        setattr(cls, test_binop_name('type_zero_vint'), partialmethod(_TestNumericField._test_binop_type_zero_vint, op=binop))
-        setattr(cls, test_binop_name('value_false'), partialmethod(_TestNumericField._test_binop_value_false, op=binop))
-        setattr(cls, test_binop_name('value_zero_int'), partialmethod(_TestNumericField._test_binop_value_zero_int, op=binop))
-        setattr(cls, test_binop_name('value_zero_vint'), partialmethod(_TestNumericField._test_binop_value_zero_vint, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_false'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_false, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_zero_int'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_zero_int, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_zero_vint'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_zero_vint, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_false'), partialmethod(_TestNumericField._test_binop_lhs_value_same_false, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_zero_int'), partialmethod(_TestNumericField._test_binop_lhs_value_same_zero_int, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_zero_vint'), partialmethod(_TestNumericField._test_binop_lhs_value_same_zero_vint, op=binop))
-        setattr(cls, test_binop_name('type_pos_float'), partialmethod(_TestNumericField._test_binop_type_pos_float, op=binop))
-        setattr(cls, test_binop_name('type_neg_float'), partialmethod(_TestNumericField._test_binop_type_neg_float, op=binop))
-        setattr(cls, test_binop_name('type_pos_vfloat'), partialmethod(_TestNumericField._test_binop_type_pos_vfloat, op=binop))
-        setattr(cls, test_binop_name('type_neg_vfloat'), partialmethod(_TestNumericField._test_binop_type_neg_vfloat, op=binop))
-        setattr(cls, test_binop_name('value_pos_float'), partialmethod(_TestNumericField._test_binop_value_pos_float, op=binop))
-        setattr(cls, test_binop_name('value_neg_float'), partialmethod(_TestNumericField._test_binop_value_neg_float, op=binop))
-        setattr(cls, test_binop_name('value_pos_vfloat'), partialmethod(_TestNumericField._test_binop_value_pos_vfloat, op=binop))
-        setattr(cls, test_binop_name('value_neg_vfloat'), partialmethod(_TestNumericField._test_binop_value_neg_vfloat, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_pos_float'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_pos_float, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_neg_float'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_neg_float, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_pos_vfloat'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_pos_vfloat, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_neg_vfloat'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_neg_vfloat, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_pos_float'), partialmethod(_TestNumericField._test_binop_lhs_value_same_pos_float, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_neg_float'), partialmethod(_TestNumericField._test_binop_lhs_value_same_neg_float, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_pos_vfloat'), partialmethod(_TestNumericField._test_binop_lhs_value_same_pos_vfloat, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_neg_vfloat'), partialmethod(_TestNumericField._test_binop_lhs_value_same_neg_vfloat, op=binop))
-        setattr(cls, test_binop_name('type_zero_float'), partialmethod(_TestNumericField._test_binop_type_zero_float, op=binop))
-        setattr(cls, test_binop_name('type_zero_vfloat'), partialmethod(_TestNumericField._test_binop_type_zero_vfloat, op=binop))
-        setattr(cls, test_binop_name('value_zero_float'), partialmethod(_TestNumericField._test_binop_value_zero_float, op=binop))
-        setattr(cls, test_binop_name('value_zero_vfloat'), partialmethod(_TestNumericField._test_binop_value_zero_vfloat, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_zero_float'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_zero_float, op=binop))
-        setattr(cls, test_binop_name('lhs_addr_same_zero_vfloat'), partialmethod(_TestNumericField._test_binop_lhs_addr_same_zero_vfloat, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_zero_float'), partialmethod(_TestNumericField._test_binop_lhs_value_same_zero_float, op=binop))
-        setattr(cls, test_binop_name('lhs_value_same_zero_vfloat'), partialmethod(_TestNumericField._test_binop_lhs_value_same_zero_vfloat, op=binop))
-
-    # inject testing methods for each unary operation
+        setattr(cls, 'test_binop_{}'.format(name), partialmethod(test_binop, op=binop))
+
+    # inject a testing method for each unary operation
     for name, unaryop in _UNARYOPS:
-        setattr(cls, test_unaryop_name('type'), partialmethod(_TestNumericField._test_unaryop_type, op=unaryop))
-        setattr(cls, test_unaryop_name('value'), partialmethod(_TestNumericField._test_unaryop_value, op=unaryop))
-        setattr(cls, test_unaryop_name('addr_same'), partialmethod(_TestNumericField._test_unaryop_addr_same, op=unaryop))
-        setattr(cls, test_unaryop_name('value_same'), partialmethod(_TestNumericField._test_unaryop_value_same, op=unaryop))
+        setattr(cls, 'test_unaryop_{}'.format(name), partialmethod(test_unaryop, op=unaryop))
 
-    # inject testing methods for each inplace binary operation
+    # inject a testing method for each inplace binary operation
     for name, ibinop in _IBINOPS:
-        setattr(cls, test_ibinop_name('invalid_unknown'), partialmethod(_TestNumericField._test_ibinop_invalid_unknown, op=ibinop))
-        setattr(cls, test_ibinop_name('invalid_none'), partialmethod(_TestNumericField._test_ibinop_invalid_none, op=ibinop))
-        setattr(cls, test_ibinop_name('type_true'), partialmethod(_TestNumericField._test_ibinop_type_true, op=ibinop))
-        setattr(cls, test_ibinop_name('value_true'), partialmethod(_TestNumericField._test_ibinop_value_true, op=ibinop))
-        setattr(cls, test_ibinop_name('type_pos_int'), partialmethod(_TestNumericField._test_ibinop_type_pos_int, op=ibinop))
-        setattr(cls, test_ibinop_name('type_pos_vint'), partialmethod(_TestNumericField._test_ibinop_type_pos_vint, op=ibinop))
-        setattr(cls, test_ibinop_name('value_pos_int'), partialmethod(_TestNumericField._test_ibinop_value_pos_int, op=ibinop))
-        setattr(cls, test_ibinop_name('value_pos_vint'), partialmethod(_TestNumericField._test_ibinop_value_pos_vint, op=ibinop))
-        setattr(cls, test_ibinop_name('type_neg_int'), partialmethod(_TestNumericField._test_ibinop_type_neg_int, op=ibinop))
-        setattr(cls, test_ibinop_name('type_neg_vint'), partialmethod(_TestNumericField._test_ibinop_type_neg_vint, op=ibinop))
-        setattr(cls, test_ibinop_name('value_neg_int'), partialmethod(_TestNumericField._test_ibinop_value_neg_int, op=ibinop))
-        setattr(cls, test_ibinop_name('value_neg_vint'), partialmethod(_TestNumericField._test_ibinop_value_neg_vint, op=ibinop))
-        setattr(cls, test_ibinop_name('type_false'), partialmethod(_TestNumericField._test_ibinop_type_false, op=ibinop))
-        setattr(cls, test_ibinop_name('value_false'), partialmethod(_TestNumericField._test_ibinop_value_false, op=ibinop))
-        setattr(cls, test_ibinop_name('type_zero_int'), partialmethod(_TestNumericField._test_ibinop_type_zero_int, op=ibinop))
-        setattr(cls, test_ibinop_name('type_zero_vint'), partialmethod(_TestNumericField._test_ibinop_type_zero_vint, op=ibinop))
-        setattr(cls, test_ibinop_name('value_zero_int'), partialmethod(_TestNumericField._test_ibinop_value_zero_int, op=ibinop))
-        setattr(cls, test_ibinop_name('value_zero_vint'), partialmethod(_TestNumericField._test_ibinop_value_zero_vint, op=ibinop))
-        setattr(cls, test_ibinop_name('type_pos_float'), partialmethod(_TestNumericField._test_ibinop_type_pos_float, op=ibinop))
-        setattr(cls, test_ibinop_name('type_neg_float'), partialmethod(_TestNumericField._test_ibinop_type_neg_float, op=ibinop))
-        setattr(cls, test_ibinop_name('type_pos_vfloat'), partialmethod(_TestNumericField._test_ibinop_type_pos_vfloat, op=ibinop))
-        setattr(cls, test_ibinop_name('type_neg_vfloat'), partialmethod(_TestNumericField._test_ibinop_type_neg_vfloat, op=ibinop))
-        setattr(cls, test_ibinop_name('value_pos_float'), partialmethod(_TestNumericField._test_ibinop_value_pos_float, op=ibinop))
-        setattr(cls, test_ibinop_name('value_neg_float'), partialmethod(_TestNumericField._test_ibinop_value_neg_float, op=ibinop))
-        setattr(cls, test_ibinop_name('value_pos_vfloat'), partialmethod(_TestNumericField._test_ibinop_value_pos_vfloat, op=ibinop))
-        setattr(cls, test_ibinop_name('value_neg_vfloat'), partialmethod(_TestNumericField._test_ibinop_value_neg_vfloat, op=ibinop))
-        setattr(cls, test_ibinop_name('type_zero_float'), partialmethod(_TestNumericField._test_ibinop_type_zero_float, op=ibinop))
-        setattr(cls, test_ibinop_name('type_zero_vfloat'), partialmethod(_TestNumericField._test_ibinop_type_zero_vfloat, op=ibinop))
-        setattr(cls, test_ibinop_name('value_zero_float'), partialmethod(_TestNumericField._test_ibinop_value_zero_float, op=ibinop))
-        setattr(cls, test_ibinop_name('value_zero_vfloat'), partialmethod(_TestNumericField._test_ibinop_value_zero_vfloat, op=ibinop))
+        setattr(cls, 'test_ibinop_{}'.format(name), partialmethod(test_ibinop, op=ibinop))
 
 
 class _TestIntegerFieldCommon(_TestNumericField):
@@ -776,36 +535,60 @@ _inject_numeric_testing_methods(_TestIntegerFieldCommon)
 
 @unittest.skip("this is broken")
 class IntegerFieldTestCase(_TestIntegerFieldCommon, unittest.TestCase):
+    _def_value = 17
+
+    # the tests only create fields from this field class: share it
+    @classmethod
+    def setUpClass(cls):
+        cls._fc = bt2.IntegerFieldClass(25, is_signed=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._fc
+
+    def _create_def(self):
+        field = self._fc()
+        field.value = self._def_value
+        return field
+
     def setUp(self):
-        self._fc = bt2.IntegerFieldClass(25, is_signed=True)
         self._field = self._fc()
-        self._def = self._fc()
-        self._def.value = 17
-        self._def_value = 17
+        self._def = self._create_def()
         self._def_new_value = -101
 
     def tearDown(self):
-        del self._fc
         del self._field
         del self._def
 
 
 @unittest.skip("this is broken")
 class EnumerationFieldTestCase(_TestIntegerFieldCommon, unittest.TestCase):
+    _def_value = 17
+
+    # the tests only create fields from this field class: share it
+    @classmethod
+    def setUpClass(cls):
+        cls._fc = bt2.EnumerationFieldClass(size=32, is_signed=True)
+        cls._fc.add_mapping('whole range', -(2 ** 31), (2 ** 31) - 1)
+        cls._fc.add_mapping('something', 17)
+        cls._fc.add_mapping('speaker', 12, 16)
+        cls._fc.add_mapping('can', 18, 2540)
+        cls._fc.add_mapping('zip', -45, 1001)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._fc
+
+    def _create_def(self):
+        field = self._fc()
+        field.value = self._def_value
+        return field
+
     def setUp(self):
-        self._fc = bt2.EnumerationFieldClass(size=32, is_signed=True)
-        self._fc.add_mapping('whole range', -(2 ** 31), (2 ** 31) - 1)
-        self._fc.add_mapping('something', 17)
-        self._fc.add_mapping('speaker', 12, 16)
-        self._fc.add_mapping('can', 18, 2540)
-        self._fc.add_mapping('zip', -45, 1001)
-        self._def = self._fc()
-        self._def.value = 17
-        self._def_value = 17
+        self._def = self._create_def()
         self._def_new_value = -101
 
     def tearDown(self):
-        del self._fc
         del self._def
 
     def test_mappings(self):
@@ -828,20 +611,16 @@ class EnumerationFieldTestCase(_TestIntegerFieldCommon, unittest.TestCase):
         self.assertTrue(0 in index_set and 1 in index_set and 2 in index_set)
 
     def test_str_op(self):
-        expected_string_found = False
         s = str(self._def)
+        prefix = '{} ('.format(self._def_value)
+        self.assertTrue(s.startswith(prefix))
+        self.assertTrue(s.endswith(')'))
 
-        # Establish all permutations of the three expected matches since
-        # the order in which mappings are enumerated is not explicitly part of
-        # the API.
-        for p in itertools.permutations(["'whole range'", "'something'",
-                                         "'zip'"]):
-            candidate = '{} ({})'.format(self._def_value, ', '.join(p))
-            if candidate == s:
-                expected_string_found = True
-                break
-
-        self.assertTrue(expected_string_found)
+        # The order in which mappings are enumerated is not explicitly
+        # part of the API: compare them as a sorted list.
+        labels = s[len(prefix):-1].split(', ')
+        self.assertEqual(sorted(labels),
+                         sorted(["'whole range'", "'something'", "'zip'"]))
 
     def test_str_op_unset(self):
         self.assertEqual(str(self._fc()), 'Unset')
@@ -849,23 +628,31 @@ class EnumerationFieldTestCase(_TestIntegerFieldCommon, unittest.TestCase):
 
 @unittest.skip("this is broken")
 class FloatingPointNumberFieldTestCase(_TestNumericField, unittest.TestCase):
+    _def_value = 52.7
+
+    # the tests only create fields from this field class: share it
+    @classmethod
+    def setUpClass(cls):
+        cls._fc = bt2.FloatingPointNumberFieldClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._fc
+
+    def _create_def(self):
+        field = self._fc()
+        field.value = self._def_value
+        return field
+
     def setUp(self):
-        self._fc = bt2.FloatingPointNumberFieldClass()
         self._field = self._fc()
-        self._def = self._fc()
-        self._def.value = 52.7
-        self._def_value = 52.7
+        self._def = self._create_def()
         self._def_new_value = -17.164857
 
     def tearDown(self):
-        del self._fc
         del self._field
         del self._def
 
-    def _test_invalid_op(self, cb):
-        with self.assertRaises(TypeError):
-            cb()
-
     def test_assign_true(self):
         self._def.value = True
         self.assertTrue(self._def)
@@ -909,23 +696,20 @@ class FloatingPointNumberFieldTestCase(_TestNumericField, unittest.TestCase):
         with self.assertRaises(TypeError):
             self._def.value = 'yes'
 
-    def test_invalid_lshift(self):
-        self._test_invalid_op(lambda: self._def << 23)
-
-    def test_invalid_rshift(self):
-        self._test_invalid_op(lambda: self._def >> 23)
-
-    def test_invalid_and(self):
-        self._test_invalid_op(lambda: self._def & 23)
-
-    def test_invalid_or(self):
-        self._test_invalid_op(lambda: self._def | 23)
-
-    def test_invalid_xor(self):
-        self._test_invalid_op(lambda: self._def ^ 23)
+    def test_invalid_bitwise_ops(self):
+        ops = (
+            ('lshift', lambda: self._def << 23),
+            ('rshift', lambda: self._def >> 23),
+            ('and', lambda: self._def & 23),
+            ('or', lambda: self._def | 23),
+            ('xor', lambda: self._def ^ 23),
+            ('invert', lambda: ~self._def),
+        )
 
-    def test_invalid_invert(self):
-        self._test_invalid_op(lambda: ~self._def)
+        for name, cb in ops:
+            with self.subTest(op=name):
+                with self.assertRaises(TypeError):
+                    cb()
 
     def test_str_op(self):
         self.assertEqual(str(self._def), str(self._def_value))
@@ -938,15 +722,29 @@ _inject_numeric_testing_methods(FloatingPointNumberFieldTestCase)
 
 @unittest.skip("this is broken")
 class StringFieldTestCase(_TestCopySimple, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._fc = bt2.StringFieldClass()
+
+        # the comparison tests only read those fields: share them
+        cls._allo = cls._fc()
+        cls._allo.value = 'allo'
+        cls._bateau = cls._fc()
+        cls._bateau.value = 'bateau'
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._fc
+        del cls._allo
+        del cls._bateau
+
     def setUp(self):
-        self._fc = bt2.StringFieldClass()
         self._def_value = 'Hello, World!'
         self._def = self._fc()
         self._def.value = self._def_value
         self._def_new_value = 'Yes!'
 
     def tearDown(self):
-        del self._fc
         del self._def
 
     def test_assign_int(self):
@@ -963,56 +761,32 @@ class StringFieldTestCase(_TestCopySimple, unittest.TestCase):
     def test_eq(self):
         self.assertEqual(self._def, self._def_value)
 
-    def test_eq(self):
+    def test_eq_invalid_type(self):
         self.assertNotEqual(self._def, 23)
 
     def test_lt_vstring(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        s2 = self._fc()
-        s2.value = 'bateau'
-        self.assertLess(s1, s2)
+        self.assertLess(self._allo, self._bateau)
 
     def test_lt_string(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        self.assertLess(s1, 'bateau')
+        self.assertLess(self._allo, 'bateau')
 
     def test_le_vstring(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        s2 = self._fc()
-        s2.value = 'bateau'
-        self.assertLessEqual(s1, s2)
+        self.assertLessEqual(self._allo, self._bateau)
 
     def test_le_string(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        self.assertLessEqual(s1, 'bateau')
+        self.assertLessEqual(self._allo, 'bateau')
 
     def test_gt_vstring(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        s2 = self._fc()
-        s2.value = 'bateau'
-        self.assertGreater(s2, s1)
+        self.assertGreater(self._bateau, self._allo)
 
     def test_gt_string(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        self.assertGreater('bateau', s1)
+        self.assertGreater('bateau', self._allo)
 
     def test_ge_vstring(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        s2 = self._fc()
-        s2.value = 'bateau'
-        self.assertGreaterEqual(s2, s1)
+        self.assertGreaterEqual(self._bateau, self._allo)
 
     def test_ge_string(self):
-        s1 = self._fc()
-        s1.value = 'allo'
-        self.assertGreaterEqual('bateau', s1)
+        self.assertGreaterEqual('bateau', self._allo)
 
     def test_bool_op(self):
         self.assertEqual(bool(self._def), bool(self._def_value))
@@ -1122,21 +896,19 @@ class _TestArraySequenceFieldCommon(_TestCopySimple):
         with self.assertRaises(TypeError):
             array_field[1] = 23
 
-    def test_setitem_none(self):
-        with self.assertRaises(TypeError):
-            self._def[1] = None
-
-    def test_setitem_index_wrong_type(self):
-        with self.assertRaises(TypeError):
-            self._def['yes'] = 23
+    def test_setitem_invalid(self):
+        # (index, value, expected exception type)
+        cases = (
+            (1, None, TypeError),
+            ('yes', 23, TypeError),
+            (-2, 23, IndexError),
+            (len(self._def), 134679, IndexError),
+        )
 
-    def test_setitem_index_neg(self):
-        with self.assertRaises(IndexError):
-            self._def[-2] = 23
-
-    def test_setitem_index_out_of_range(self):
-        with self.assertRaises(IndexError):
-            self._def[len(self._def)] = 134679
+        for index, value, exc_type in cases:
+            with self.subTest(index=index, value=value):
+                with self.assertRaises(exc_type):
+                    self._def[index] = value
 
     def test_iter(self):
         for field, value in zip(self._def, (45, 1847, 1948754)):
@@ -1231,9 +1003,17 @@ class _TestArraySequenceFieldCommon(_TestCopySimple):
 
 @unittest.skip("this is broken")
 class ArrayFieldTestCase(_TestArraySequenceFieldCommon, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._elem_fc = bt2.IntegerFieldClass(32)
+        cls._fc = bt2.ArrayFieldClass(cls._elem_fc, 3)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._elem_fc
+        del cls._fc
+
     def setUp(self):
-        self._elem_fc = bt2.IntegerFieldClass(32)
-        self._fc = bt2.ArrayFieldClass(self._elem_fc, 3)
         self._def = self._fc()
         self._def[0] = 45
         self._def[1] = 1847
@@ -1241,8 +1021,6 @@ class ArrayFieldTestCase(_TestArraySequenceFieldCommon, unittest.TestCase):
         self._def_value = [45, 1847, 1948754]
 
     def tearDown(self):
-        del self._elem_fc
-        del self._fc
         del self._def
 
     def test_value_wrong_len(self):
@@ -1253,9 +1031,17 @@ class ArrayFieldTestCase(_TestArraySequenceFieldCommon, unittest.TestCase):
 
 @unittest.skip("this is broken")
 class SequenceFieldTestCase(_TestArraySequenceFieldCommon, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._elem_fc = bt2.IntegerFieldClass(32)
+        cls._fc = bt2.SequenceFieldClass(cls._elem_fc, 'the.length')
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._elem_fc
+        del cls._fc
+
     def setUp(self):
-        self._elem_fc = bt2.IntegerFieldClass(32)
-        self._fc = bt2.SequenceFieldClass(self._elem_fc, 'the.length')
         self._def = self._fc()
         self._length_field = self._elem_fc(3)
         self._def.length_field = self._length_field
@@ -1265,8 +1051,6 @@ class SequenceFieldTestCase(_TestArraySequenceFieldCommon, unittest.TestCase):
         self._def_value = [45, 1847, 1948754]
 
     def tearDown(self):
-        del self._elem_fc
-        del self._fc
         del self._def
         del self._length_field
 
@@ -1288,34 +1072,37 @@ class SequenceFieldTestCase(_TestArraySequenceFieldCommon, unittest.TestCase):
 
 @unittest.skip("this is broken")
 class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._fc0 = bt2.IntegerFieldClass(32, is_signed=True)
+        cls._fc1 = bt2.StringFieldClass()
+        cls._fc2 = bt2.FloatingPointNumberFieldClass()
+        cls._fc3 = bt2.IntegerFieldClass(17)
+        cls._fc = bt2.StructureFieldClass()
+        cls._fc.append_field('A', cls._fc0)
+        cls._fc.append_field('B', cls._fc1)
+        cls._fc.append_field('C', cls._fc2)
+        cls._fc.append_field('D', cls._fc3)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._fc0
+        del cls._fc1
+        del cls._fc2
+        del cls._fc3
+        del cls._fc
+
     def setUp(self):
-        self._fc0 = bt2.IntegerFieldClass(32, is_signed=True)
-        self._fc1 = bt2.StringFieldClass()
-        self._fc2 = bt2.FloatingPointNumberFieldClass()
-        self._fc3 = bt2.IntegerFieldClass(17)
-        self._fc = bt2.StructureFieldClass()
-        self._fc.append_field('A', self._fc0)
-        self._fc.append_field('B', self._fc1)
-        self._fc.append_field('C', self._fc2)
-        self._fc.append_field('D', self._fc3)
-        self._def = self._fc()
-        self._def['A'] = -1872
-        self._def['B'] = 'salut'
-        self._def['C'] = 17.5
-        self._def['D'] = 16497
         self._def_value = {
             'A': -1872,
             'B': 'salut',
             'C': 17.5,
             'D': 16497
         }
+        self._def = self._fc()
+        self._def.value = self._def_value
 
     def tearDown(self):
-        del self._fc0
-        del self._fc1
-        del self._fc2
-        del self._fc3
-        del self._fc
         del self._def
 
     def _modify_def(self):
@@ -1348,10 +1135,7 @@ class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
         fc.append_field('C', self._fc2)
         fc.append_field('D', self._fc3)
         field = fc()
-        field['A'] = -1872
-        field['B'] = 'salut'
-        field['C'] = 17.5
-        field['D'] = 16497
+        field.value = self._def_value
         self.assertEqual(self._def, field)
 
     def test_eq_invalid_type(self):
@@ -1363,9 +1147,7 @@ class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
         fc.append_field('B', self._fc1)
         fc.append_field('C', self._fc2)
         field = fc()
-        field['A'] = -1872
-        field['B'] = 'salut'
-        field['C'] = 17.5
+        field.value = {'A': -1872, 'B': 'salut', 'C': 17.5}
         self.assertNotEqual(self._def, field)
 
     def test_eq_diff_content_same_len(self):
@@ -1375,10 +1157,7 @@ class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
         fc.append_field('C', self._fc2)
         fc.append_field('D', self._fc3)
         field = fc()
-        field['A'] = -1872
-        field['B'] = 'salut'
-        field['C'] = 17.4
-        field['D'] = 16497
+        field.value = dict(self._def_value, C=17.4)
         self.assertNotEqual(self._def, field)
 
     def test_eq_same_content_diff_keys(self):
@@ -1388,10 +1167,7 @@ class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
         fc.append_field('E', self._fc2)
         fc.append_field('D', self._fc3)
         field = fc()
-        field['A'] = -1872
-        field['B'] = 'salut'
-        field['E'] = 17.4
-        field['D'] = 16497
+        field.value = {'A': -1872, 'B': 'salut', 'E': 17.4, 'D': 16497}
         self.assertNotEqual(self._def, field)
 
     def test_setitem(self):
@@ -1536,19 +1312,16 @@ class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
         self.assertEqual(struct_fc(), struct)
 
     def test_str_op(self):
-        expected_string_found = False
         s = str(self._def)
-        # Establish all permutations of the three expected matches since
-        # the order in which mappings are enumerated is not explicitly part of
-        # the API.
-        for p in itertools.permutations([(k, v) for k, v in self._def.items()]):
-            items = ['{}: {}'.format(repr(k), repr(v)) for k, v in p]
-            candidate = '{{{}}}'.format(', '.join(items))
-            if candidate == s:
-                expected_string_found = True
-                break
-
-        self.assertTrue(expected_string_found)
+        self.assertTrue(s.startswith('{'))
+        self.assertTrue(s.endswith('}'))
+
+        # The order in which members are enumerated is not explicitly
+        # part of the API: compare them as a sorted list.
+        items = s[1:-1].split(', ')
+        expected_items = ['{}: {}'.format(repr(k), repr(v))
+                          for k, v in self._def.items()]
+        self.assertEqual(sorted(items), sorted(expected_items))
 
     def test_str_op_unset(self):
         self.assertEqual(str(self._fc()), 'Unset')
@@ -1556,30 +1329,36 @@ class StructureFieldTestCase(_TestCopySimple, unittest.TestCase):
 
 @unittest.skip("this is broken")
 class VariantFieldTestCase(_TestCopySimple, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tag_fc = bt2.EnumerationFieldClass(size=32)
+        cls._tag_fc.add_mapping('corner', 23)
+        cls._tag_fc.add_mapping('zoom', 17, 20)
+        cls._tag_fc.add_mapping('mellotron', 1001)
+        cls._tag_fc.add_mapping('giorgio', 2000, 3000)
+        cls._fc0 = bt2.IntegerFieldClass(32, is_signed=True)
+        cls._fc1 = bt2.StringFieldClass()
+        cls._fc2 = bt2.FloatingPointNumberFieldClass()
+        cls._fc3 = bt2.IntegerFieldClass(17)
+        cls._fc = bt2.VariantFieldClass('salut', cls._tag_fc)
+        cls._fc.append_field('corner', cls._fc0)
+        cls._fc.append_field('zoom', cls._fc1)
+        cls._fc.append_field('mellotron', cls._fc2)
+        cls._fc.append_field('giorgio', cls._fc3)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._tag_fc
+        del cls._fc0
+        del cls._fc1
+        del cls._fc2
+        del cls._fc3
+        del cls._fc
+
     def setUp(self):
-        self._tag_fc = bt2.EnumerationFieldClass(size=32)
-        self._tag_fc.add_mapping('corner', 23)
-        self._tag_fc.add_mapping('zoom', 17, 20)
-        self._tag_fc.add_mapping('mellotron', 1001)
-        self._tag_fc.add_mapping('giorgio', 2000, 3000)
-        self._fc0 = bt2.IntegerFieldClass(32, is_signed=True)
-        self._fc1 = bt2.StringFieldClass()
-        self._fc2 = bt2.FloatingPointNumberFieldClass()
-        self._fc3 = bt2.IntegerFieldClass(17)
-        self._fc = bt2.VariantFieldClass('salut', self._tag_fc)
-        self._fc.append_field('corner', self._fc0)
-        self._fc.append_field('zoom', self._fc1)
-        self._fc.append_field('mellotron', self._fc2)
-        self._fc.append_field('giorgio', self._fc3)
         self._def = self._fc()
 
     def tearDown(self):
-        del self._tag_fc
-        del self._fc0
-        del self._fc1
-        del self._fc2
-        del self._fc3
-        del self._fc
         del self._def
 
     def test_bool_op_true(self):
@@ -44,42 +44,64 @@ class _TestInvalidEq:
         self.assertFalse(self._fc == 23)
 
 
-class _TestIntegerFieldClassProps:
+# Tests which only read the field class, or which expect an assignment
+# to fail before anything is modified: the test cases which use them
+# create their `_ro_fc` field class once in setUpClass() and have no
+# per-test setUp(), so those tests must not modify `_ro_fc`.
+class _TestIntegerFieldClassReadOnlyProps:
     def test_size_prop(self):
-        self.assertEqual(self._fc.size, 35)
+        self.assertEqual(self._ro_fc.size, 35)
+
+    def test_assign_invalid_signed(self):
+        with self.assertRaises(TypeError):
+            self._ro_fc.is_signed = 23
 
+    def test_assign_invalid_base(self):
+        with self.assertRaises(TypeError):
+            self._ro_fc.base = 'hey'
+
+    def test_assign_invalid_encoding(self):
+        with self.assertRaises(TypeError):
+            self._ro_fc.encoding = 'hey'
+
+    def test_assign_invalid_mapped_clock_class(self):
+        with self.assertRaises(TypeError):
+            self._ro_fc.mapped_clock_class = object()
+
+
+class _TestIntegerFieldClassProps:
     def test_assign_signed(self):
         self._fc.is_signed = True
         self.assertTrue(self._fc.is_signed)
 
-    def test_assign_invalid_signed(self):
-        with self.assertRaises(TypeError):
-            self._fc.is_signed = 23
-
     def test_assign_base(self):
         self._fc.base = bt2.Base.HEXADECIMAL
         self.assertEqual(self._fc.base, bt2.Base.HEXADECIMAL)
 
-    def test_assign_invalid_base(self):
-        with self.assertRaises(TypeError):
-            self._fc.base = 'hey'
-
     def test_assign_encoding(self):
         self._fc.encoding = bt2.Encoding.UTF8
         self.assertEqual(self._fc.encoding, bt2.Encoding.UTF8)
 
-    def test_assign_invalid_encoding(self):
-        with self.assertRaises(TypeError):
-            self._fc.encoding = 'hey'
-
     def test_assign_mapped_clock_class(self):
         cc = bt2.ClockClass('name', 1000)
         self._fc.mapped_clock_class = cc
         self.assertEqual(self._fc.mapped_clock_class, cc)
 
-    def test_assign_invalid_mapped_clock_class(self):
-        with self.assertRaises(TypeError):
-            self._fc.mapped_clock_class = object()
+
+@unittest.skip("this is broken")
+class IntegerFieldClassReadOnlyTestCase(_TestIntegerFieldClassReadOnlyProps,
+                                       unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._ro_fc = bt2.IntegerFieldClass(35)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._ro_fc
+
+    def test_create_default(self):
+        self.assertEqual(self._ro_fc.size, 35)
+        self.assertIsNone(self._ro_fc.mapped_clock_class)
 
 
 @unittest.skip("this is broken")
@@ -92,21 +114,17 @@ class IntegerFieldClassTestCase(_TestIntegerFieldClassProps, _TestCopySimple,
     def tearDown(self):
         del self._fc
 
-    def test_create_default(self):
-        self.assertEqual(self._fc.size, 35)
-        self.assertIsNone(self._fc.mapped_clock_class)
-
     def test_create_invalid_size(self):
-        with self.assertRaises(TypeError):
-            fc = bt2.IntegerFieldClass('yes')
-
-    def test_create_neg_size(self):
-        with self.assertRaises(ValueError):
-            fc = bt2.IntegerFieldClass(-2)
+        invalid_sizes = (
+            ('yes', TypeError),
+            (-2, ValueError),
+            (0, ValueError),
+        )
 
-    def test_create_neg_zero(self):
-        with self.assertRaises(ValueError):
-            fc = bt2.IntegerFieldClass(0)
+        for size, exc_type in invalid_sizes:
+            with self.subTest(size=size):
+                with self.assertRaises(exc_type):
+                    fc = bt2.IntegerFieldClass(size)
 
     def test_create_full(self):
         cc = bt2.ClockClass('name', 1000)
@@ -180,10 +198,34 @@ class FloatingPointNumberFieldClassTestCase(_TestCopySimple, _TestAlignmentProp,
         self.assertEqual(field, 17.5)
 
 
+@unittest.skip("this is broken")
+class EnumerationFieldClassReadOnlyTestCase(_TestIntegerFieldClassReadOnlyProps,
+                                           unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._ro_fc = bt2.EnumerationFieldClass(size=35)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._ro_fc
+
+
 @unittest.skip("this is broken")
 class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
                                    _TestCopySimple, _TestAlignmentProp,
                                    _TestByteOrderProp, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # mappings which test_iadd() adds to its own field class
+        cls._iadd_fc = bt2.EnumerationFieldClass(size=16)
+        cls._iadd_fc.add_mapping('c', 4, 5)
+        cls._iadd_fc.add_mapping('d', 6, 18)
+        cls._iadd_fc.add_mapping('e', 20, 27)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._iadd_fc
+
     def setUp(self):
         self._fc = bt2.EnumerationFieldClass(size=35)
 
@@ -195,13 +237,10 @@ class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
         self._fc = bt2.EnumerationFieldClass(int_fc)
 
     def test_create_from_invalid_type(self):
-        with self.assertRaises(TypeError):
-            self._fc = bt2.EnumerationFieldClass('coucou')
-
-    def test_create_from_invalid_fc(self):
-        with self.assertRaises(TypeError):
-            fc = bt2.FloatingPointNumberFieldClass()
-            self._fc = bt2.EnumerationFieldClass(fc)
+        for int_fc in ('coucou', bt2.FloatingPointNumberFieldClass()):
+            with self.subTest(int_fc=int_fc):
+                with self.assertRaises(TypeError):
+                    self._fc = bt2.EnumerationFieldClass(int_fc)
 
     def test_create_full(self):
         fc = bt2.EnumerationFieldClass(size=24, alignment=16,
@@ -217,6 +256,21 @@ class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
         self.assertEqual(fc.encoding, bt2.Encoding.NONE)
         #self.assertIsNone(fc.mapped_clock_class)
 
+    def test_create_with_mappings(self):
+        fc = bt2.EnumerationFieldClass(size=24, mappings=(
+            ('hello', 24, 24),
+            ('world', 21, 199),
+        ))
+        self.assertEqual(len(fc), 2)
+        self.assertEqual((fc[0].name, fc[0].lower, fc[0].upper),
+                         ('hello', 24, 24))
+        self.assertEqual((fc[1].name, fc[1].lower, fc[1].upper),
+                         ('world', 21, 199))
+
+    def test_create_with_invalid_mappings(self):
+        with self.assertRaises(TypeError):
+            fc = bt2.EnumerationFieldClass(size=24, mappings=((17, 21, 199),))
+
     def test_integer_field_class_prop(self):
         int_fc = bt2.IntegerFieldClass(23)
         enum_fc = bt2.EnumerationFieldClass(int_fc)
@@ -225,75 +279,92 @@ class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
     def test_add_mapping_simple(self):
         self._fc.add_mapping('hello', 24)
         mapping = self._fc[0]
-        self.assertEqual(mapping.name, 'hello')
-        self.assertEqual(mapping.lower, 24)
-        self.assertEqual(mapping.upper, 24)
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', 24, 24))
 
     def test_add_mapping_simple_kwargs(self):
         self._fc.add_mapping(name='hello', lower=17, upper=23)
         mapping = self._fc[0]
-        self.assertEqual(mapping.name, 'hello')
-        self.assertEqual(mapping.lower, 17)
-        self.assertEqual(mapping.upper, 23)
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', 17, 23))
 
     def test_add_mapping_range(self):
         self._fc.add_mapping('hello', 21, 199)
         mapping = self._fc[0]
-        self.assertEqual(mapping.name, 'hello')
-        self.assertEqual(mapping.lower, 21)
-        self.assertEqual(mapping.upper, 199)
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', 21, 199))
 
     def test_add_mapping_invalid_name(self):
         with self.assertRaises(TypeError):
             self._fc.add_mapping(17, 21, 199)
 
-    def test_add_mapping_invalid_signedness_lower(self):
-        with self.assertRaises(ValueError):
-            self._fc.add_mapping('hello', -21, 199)
-
-    def test_add_mapping_invalid_signedness_upper(self):
-        with self.assertRaises(ValueError):
-            self._fc.add_mapping('hello', 21, -199)
+    def test_add_mapping_invalid_signedness(self):
+        for lower, upper in ((-21, 199), (21, -199)):
+            with self.subTest(lower=lower, upper=upper):
+                with self.assertRaises(ValueError):
+                    self._fc.add_mapping('hello', lower, upper)
 
     def test_add_mapping_simple_signed(self):
         self._fc.is_signed = True
         self._fc.add_mapping('hello', -24)
         mapping = self._fc[0]
-        self.assertEqual(mapping.name, 'hello')
-        self.assertEqual(mapping.lower, -24)
-        self.assertEqual(mapping.upper, -24)
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', -24, -24))
 
     def test_add_mapping_range_signed(self):
         self._fc.is_signed = True
         self._fc.add_mapping('hello', -21, 199)
         mapping = self._fc[0]
-        self.assertEqual(mapping.name, 'hello')
-        self.assertEqual(mapping.lower, -21)
-        self.assertEqual(mapping.upper, 199)
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', -21, 199))
+
+    def test_add_mappings(self):
+        self._fc.add_mappings((('hello', 24, 24), ('world', 21, 199)))
+        self.assertEqual(len(self._fc), 2)
+        mapping = self._fc[0]
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', 24, 24))
+        mapping = self._fc[1]
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('world', 21, 199))
+
+    def test_add_mappings_signed(self):
+        self._fc.is_signed = True
+        self._fc.add_mappings((('hello', -21, 199),))
+        mapping = self._fc[0]
+        self.assertEqual((mapping.name, mapping.lower, mapping.upper),
+                         ('hello', -21, 199))
+
+    def test_add_mappings_invalid_name(self):
+        with self.assertRaises(TypeError):
+            self._fc.add_mappings(((17, 21, 199),))
+
+    def test_add_mappings_invalid_signedness(self):
+        with self.assertRaises(ValueError):
+            self._fc.add_mappings((('hello', -21, 199),))
+
+    def test_add_mappings_invalid_tuple(self):
+        with self.assertRaises(ValueError):
+            self._fc.add_mappings((('hello', 24, 24), ('world', 21)))
+
+        self.assertEqual(len(self._fc), 0)
 
     def test_iadd(self):
-        enum_fc = bt2.EnumerationFieldClass(size=16)
-        enum_fc.add_mapping('c', 4, 5)
-        enum_fc.add_mapping('d', 6, 18)
-        enum_fc.add_mapping('e', 20, 27)
         self._fc.add_mapping('a', 0, 2)
         self._fc.add_mapping('b', 3)
-        self._fc += enum_fc
-        self.assertEqual(self._fc[0].name, 'a')
-        self.assertEqual(self._fc[0].lower, 0)
-        self.assertEqual(self._fc[0].upper, 2)
-        self.assertEqual(self._fc[1].name, 'b')
-        self.assertEqual(self._fc[1].lower, 3)
-        self.assertEqual(self._fc[1].upper, 3)
-        self.assertEqual(self._fc[2].name, 'c')
-        self.assertEqual(self._fc[2].lower, 4)
-        self.assertEqual(self._fc[2].upper, 5)
-        self.assertEqual(self._fc[3].name, 'd')
-        self.assertEqual(self._fc[3].lower, 6)
-        self.assertEqual(self._fc[3].upper, 18)
-        self.assertEqual(self._fc[4].name, 'e')
-        self.assertEqual(self._fc[4].lower, 20)
-        self.assertEqual(self._fc[4].upper, 27)
+        self._fc += self._iadd_fc
+        expected_mappings = (
+            ('a', 0, 2),
+            ('b', 3, 3),
+            ('c', 4, 5),
+            ('d', 6, 18),
+            ('e', 20, 27),
+        )
+        self.assertEqual(len(self._fc), len(expected_mappings))
+
+        for fc_mapping, mapping in zip(self._fc, expected_mappings):
+            self.assertEqual((fc_mapping.name, fc_mapping.lower, fc_mapping.upper),
+                             mapping)
 
     def test_bool_op(self):
         self.assertFalse(self._fc)
@@ -323,13 +394,11 @@ class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
             ('d', 22510, 99999),
         )
 
-        for mapping in mappings:
-            self._fc.add_mapping(*mapping)
+        self._fc.add_mappings(mappings)
 
         for fc_mapping, mapping in zip(self._fc, mappings):
-            self.assertEqual(fc_mapping.name, mapping[0])
-            self.assertEqual(fc_mapping.lower, mapping[1])
-            self.assertEqual(fc_mapping.upper, mapping[2])
+            self.assertEqual((fc_mapping.name, fc_mapping.lower, fc_mapping.upper),
+                             mapping)
 
     def test_mapping_eq(self):
         enum1 = bt2.EnumerationFieldClass(size=32)
@@ -343,12 +412,14 @@ class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
         enum1.add_mapping('b', 1, 3)
         self.assertNotEqual(enum1[0], 23)
 
-    def _test_find_by_name(self, fc):
-        fc.add_mapping('a', 0)
-        fc.add_mapping('b', 1, 3)
-        fc.add_mapping('a', 5)
-        fc.add_mapping('a', 17, 144)
-        fc.add_mapping('C', 5)
+    def _test_find_by_name(self, is_signed):
+        fc = bt2.EnumerationFieldClass(size=8, is_signed=is_signed, mappings=(
+            ('a', 0, 0),
+            ('b', 1, 3),
+            ('a', 5, 5),
+            ('a', 17, 144),
+            ('C', 5, 5),
+        ))
         mapping_iter = fc.mappings_by_name('a')
         mappings = list(mapping_iter)
         a0 = False
@@ -372,51 +443,29 @@ class EnumerationFieldClassTestCase(_TestIntegerFieldClassProps, _TestInvalidEq,
         self.assertTrue(a5)
         self.assertTrue(a17_144)
 
-    def test_find_by_name_signed(self):
-        self._test_find_by_name(bt2.EnumerationFieldClass(size=8, is_signed=True))
-
-    def test_find_by_name_unsigned(self):
-        self._test_find_by_name(bt2.EnumerationFieldClass(size=8))
-
-    def _test_find_by_value(self, fc):
-        fc.add_mapping('a', 0)
-        fc.add_mapping('b', 1, 3)
-        fc.add_mapping('c', 5, 19)
-        fc.add_mapping('d', 8, 15)
-        fc.add_mapping('e', 10, 21)
-        fc.add_mapping('f', 0)
-        fc.add_mapping('g', 14)
+    def test_find_by_name(self):
+        for is_signed in (True, False):
+            with self.subTest(is_signed=is_signed):
+                self._test_find_by_name(is_signed)
+
+    def _test_find_by_value(self, is_signed):
+        fc = bt2.EnumerationFieldClass(size=8, is_signed=is_signed, mappings=(
+            ('a', 0, 0),
+            ('b', 1, 3),
+            ('c', 5, 19),
+            ('d', 8, 15),
+            ('e', 10, 21),
+            ('f', 0, 0),
+            ('g', 14, 14),
+        ))
         mapping_iter = fc.mappings_by_value(14)
-        mappings = list(mapping_iter)
-        c = False
-        d = False
-        e = False
-        g = False
-        i = 0
-
-        for mapping in mappings:
-            i += 1
-
-            if mapping.name == 'c':
-                c = True
-            elif mapping.name == 'd':
-                d = True
-            elif mapping.name == 'e':
-                e = True
-            elif mapping.name == 'g':
-                g = True
-
-        self.assertEqual(i, 4)
-        self.assertTrue(c)
-        self.assertTrue(d)
-        self.assertTrue(e)
-        self.assertTrue(g)
-
-    def test_find_by_value_signed(self):
-        self._test_find_by_value(bt2.EnumerationFieldClass(size=8, is_signed=True))
+        names = sorted(mapping.name for mapping in mapping_iter)
+        self.assertEqual(names, ['c', 'd', 'e', 'g'])
 
-    def test_find_by_value_unsigned(self):
-        self._test_find_by_value(bt2.EnumerationFieldClass(size=8))
+    def test_find_by_value(self):
+        for is_signed in (True, False):
+            with self.subTest(is_signed=is_signed):
+                self._test_find_by_value(is_signed)
 
     def test_create_field(self):
         self._fc.add_mapping('c', 4, 5)
@@ -502,6 +551,16 @@ class _TestFieldContainer(_TestInvalidEq, _TestCopySimple):
         self.assertEqual(self._fc['d_enum'], d_field_class)
         self.assertEqual(self._fc['e_struct'], e_field_class)
 
+    def test_iadd_duplicate_name(self):
+        int_field_class = bt2.IntegerFieldClass(32)
+        self._fc.append_field('a_int', int_field_class)
+
+        with self.assertRaises(bt2.Error):
+            self._fc += {'a_int': bt2.StringFieldClass()}
+
+        self.assertEqual(len(self._fc), 1)
+        self.assertEqual(self._fc['a_int'], int_field_class)
+
     def test_bool_op(self):
         self.assertFalse(self._fc)
         self._fc.append_field('a', bt2.StringFieldClass())
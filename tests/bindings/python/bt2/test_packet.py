@@ -1,5 +1,4 @@
 from collections import OrderedDict
-from bt2 import value
 import unittest
 import copy
 import bt2
@@ -7,13 +6,33 @@ import bt2
 
 @unittest.skip("this is broken")
 class PacketTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._stream_cache = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls._stream_cache
+
     def setUp(self):
         self._packet = self._create_packet()
 
     def tearDown(self):
         del self._packet
 
+    # Packets are compared by header and context fields only: all the
+    # packets created with the same parameters can come from the same
+    # stream.
     def _create_packet(self, with_ph=True, with_pc=True):
+        key = (with_ph, with_pc)
+
+        if key not in self._stream_cache:
+            self._stream_cache[key] = self._create_stream(with_ph, with_pc)
+
+        return self._stream_cache[key].create_packet()
+
+    @staticmethod
+    def _create_stream(with_ph=True, with_pc=True):
         # event header
         eh = bt2.StructureFieldClass()
         eh += OrderedDict((
@@ -81,10 +100,7 @@ class PacketTestCase(unittest.TestCase):
         tc.add_stream_class(sc)
 
         # stream
-        stream = sc()
-
-        # packet
-        return stream.create_packet()
+        return sc()
 
     def test_attr_stream(self):
         self.assertIsNotNone(self._packet.stream)
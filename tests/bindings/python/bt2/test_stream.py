@@ -1,5 +1,4 @@
 from collections import OrderedDict
-from bt2 import value
 import unittest
 import copy
 import bt2
@@ -13,7 +12,8 @@ class StreamTestCase(unittest.TestCase):
     def tearDown(self):
         del self._stream
 
-    def _create_stream(self, name='my_stream', stream_id=None):
+    @staticmethod
+    def _create_stream(name='my_stream', stream_id=None):
         # event header
         eh = bt2.StructureFieldClass()
         eh += OrderedDict((
@@ -1,4 +1,3 @@
-from bt2 import value
 import unittest
 import copy
 import uuid
@@ -8,11 +7,9 @@ import bt2
 @unittest.skip("this is broken")
 class TraceTestCase(unittest.TestCase):
     def setUp(self):
-        self._sc = self._create_stream_class('sc1', 3)
         self._tc = bt2.Trace()
 
     def tearDown(self):
-        del self._sc
         del self._tc
 
     def _create_stream_class(self, name, id):
@@ -140,22 +137,23 @@ class TraceTestCase(unittest.TestCase):
         self.assertNotEqual(self._tc.env['bateau'].addr, cpy.env['bateau'].addr)
 
     def test_getitem(self):
-        self._tc.add_stream_class(self._sc)
-        self.assertEqual(self._tc[3].addr, self._sc.addr)
+        sc = self._create_stream_class('sc1', 3)
+        self._tc.add_stream_class(sc)
+        self.assertEqual(self._tc[3].addr, sc.addr)
 
     def test_getitem_wrong_key_type(self):
-        self._tc.add_stream_class(self._sc)
+        self._tc.add_stream_class(self._create_stream_class('sc1', 3))
         with self.assertRaises(TypeError):
             self._tc['hello']
 
     def test_getitem_wrong_key(self):
-        self._tc.add_stream_class(self._sc)
+        self._tc.add_stream_class(self._create_stream_class('sc1', 3))
         with self.assertRaises(KeyError):
             self._tc[4]
 
     def test_len(self):
         self.assertEqual(len(self._tc), 0)
-        self._tc.add_stream_class(self._sc)
+        self._tc.add_stream_class(self._create_stream_class('sc1', 3))
         self.assertEqual(len(self._tc), 1)
 
     def test_iter(self):
@@ -167,15 +165,11 @@ class TraceTestCase(unittest.TestCase):
         self._tc.add_stream_class(sc2)
         self._tc.add_stream_class(sc3)
 
-        for sid, stream_class in self._tc.items():
+        for stream_class in self._tc.values():
             self.assertIsInstance(stream_class, bt2.StreamClass)
 
-            if sid == 3:
-                self.assertEqual(stream_class.addr, sc1.addr)
-            elif sid == 9:
-                self.assertEqual(stream_class.addr, sc2.addr)
-            elif sid == 17:
-                self.assertEqual(stream_class.addr, sc3.addr)
+        addrs = {sid: stream_class.addr for sid, stream_class in self._tc.items()}
+        self.assertEqual(addrs, {3: sc1.addr, 9: sc2.addr, 17: sc3.addr})
 
     def test_env_getitem_wrong_key(self):
         with self.assertRaises(KeyError):
@@ -200,13 +194,8 @@ class TraceTestCase(unittest.TestCase):
         stream0 = self._tc[3](id=12)
         stream1 = self._tc[3](id=15)
         stream2 = self._tc[3](id=17)
-        sids = set()
-
-        for stream in self._tc.streams:
-            sids.add(stream.id)
-
-        self.assertEqual(len(sids), 3)
-        self.assertTrue(12 in sids and 15 in sids and 17 in sids)
+        sids = {stream.id for stream in self._tc.streams}
+        self.assertEqual(sids, {12, 15, 17})
 
     def _test_eq_create_objects(self):
         cc1_uuid = uuid.UUID('bc7f2f2d-2ee4-4e03-ab1f-2e0e1304e94f')